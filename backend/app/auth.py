@@ -1,13 +1,18 @@
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.database import get_db, Settings
+from app.models import USERS_DELETED
+from app.services.passwords import PasswordHasherPool, PasswordPoolBusy
+from app.services.versions import get_version
 
 settings = Settings()
 
@@ -15,16 +20,83 @@ SECRET_KEY = getattr(settings, "secret_key", "dev-secret-key-change-in-productio
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
 
+class UserCache:
+    """
+    user id -> users 컬럼 값 (TTL + LRU, 프로세스 내)
+    - 프로필/비밀번호 변경, 탈퇴 시 invalidate (hashed_password는 저장하지 않음)
+    - 다른 worker에서의 프로필 변경은 TTL 이내에 반영
+    - 다른 worker에서의 탈퇴는 table_versions의 USERS_DELETED가 바뀌면 전체 비움 (poll 주기 이내)
+      -> 탈퇴한 계정이 캐시로 인증되어 쓰기가 FK 오류로 실패하지 않도록
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._deleted_version = get_version(USERS_DELETED)
+
+    def get(self, user_id: int) -> Optional[dict]:
+        deleted_version = get_version(USERS_DELETED)
+        with self._lock:
+            if deleted_version != self._deleted_version:
+                self._data.clear()
+                self._deleted_version = deleted_version
+            entry = self._data.get(user_id)
+            if entry is None:
+                return None
+            expires_at, values = entry
+            if expires_at < time.monotonic():
+                del self._data[user_id]
+                return None
+            self._data.move_to_end(user_id)
+            return values
+
+    def set(self, user_id: int, values: dict):
+        with self._lock:
+            self._data[user_id] = (time.monotonic() + self.ttl, values)
+            self._data.move_to_end(user_id)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._data.pop(user_id, None)
+
+
+user_cache = UserCache(max_size=settings.user_cache_max_size, ttl=settings.user_cache_ttl_seconds)
+
+
+# bcrypt는 요청 스레드가 아닌 별도 프로세스 풀에서 실행
+password_pool = PasswordHasherPool(
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
+
+
+def _password_pool_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many authentication requests, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    try:
+        return password_pool.hash(password)
+    except PasswordPoolBusy:
+        raise _password_pool_busy()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return password_pool.verify(plain_password, hashed_password)
+    except PasswordPoolBusy:
+        raise _password_pool_busy()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -34,10 +106,19 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def get_current_user(
-    token: Optional[str] = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-):
+def _decode_user_id(token: str) -> Optional[int]:
+    """JWT 검증 후 sub(user id) 반환, 유효하지 않으면 None"""
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        sub = payload.get("sub")
+        if sub is None:
+            return None
+        return int(sub)
+    except (JWTError, ValueError):
+        return None
+
+
+def _require_user_id(token: Optional[str]) -> int:
     if token is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -45,34 +126,67 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        sub = payload.get("sub")
-        if sub is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-    except JWTError:
+    user_id = _decode_user_id(token)
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return user_id
 
-    from app.models.user import User
-    user = db.query(User).filter(User.id == int(sub)).first()
+
+def _user_or_401(user):
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return user
 
+
+def _cached_user(user_id: int):
+    """캐시된 컬럼 값으로 detached User 생성 (세션에는 merge(load=False)로 SELECT 없이 붙임)"""
+    values = user_cache.get(user_id)
+    if values is None:
+        return None
+
+    from app.models.user import User
+    user = User(**values)
+    make_transient_to_detached(user)
     return user
 
 
+# 비밀번호 hash는 캐시하지 않음 (다른 worker에서 바뀐 비밀번호가 TTL 동안 무시되지 않도록, 확인은 DB에서)
+_UNCACHED_COLUMNS = ("hashed_password",)
+
+
+def _cache_user(user):
+    if user is not None:
+        user_cache.set(user.id, {
+            c.key: getattr(user, c.key) for c in user.__table__.columns if c.key not in _UNCACHED_COLUMNS
+        })
+    return user
+
+
+def _load_user(db: Session, user_id: int):
+    cached = _cached_user(user_id)
+    if cached is not None:
+        return db.merge(cached, load=False)
+
+    from app.models.user import User
+    return _cache_user(db.query(User).filter(User.id == user_id).first())
+
+
+def get_current_user(
+    token: Optional[str] = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+):
+    user_id = _require_user_id(token)
+    return _user_or_401(_load_user(db, user_id))
+
+
 def get_optional_user(
     token: Optional[str] = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
@@ -80,13 +194,22 @@ def get_optional_user(
     if token is None:
         return None
 
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        sub = payload.get("sub")
-        if sub is None:
-            return None
-    except JWTError:
+    user_id = _decode_user_id(token)
+    if user_id is None:
         return None
 
-    from app.models.user import User
-    return db.query(User).filter(User.id == int(sub)).first()
+    return _load_user(db, user_id)
+
+
+# --- user id만 필요한 조회 엔드포인트용 (토큰 claim만 확인, DB 조회 없음) ---
+# - 탈퇴 여부를 확인하지 않으므로 쓰기 경로는 get_current_user 사용 (캐시 + 탈퇴 시 무효화)
+# - 순수 CPU 작업이라 threadpool을 거치지 않도록 async로 선언
+
+async def get_current_user_id(token: Optional[str] = Depends(oauth2_scheme)) -> int:
+    return _require_user_id(token)
+
+
+async def get_optional_user_id(token: Optional[str] = Depends(oauth2_scheme)) -> Optional[int]:
+    if token is None:
+        return None
+    return _decode_user_id(token)
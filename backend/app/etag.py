@@ -0,0 +1,57 @@
+import hashlib
+import time
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response, status
+
+from app.services.versions import BOOT_ID, get_version, is_db_versioned
+
+
+def make_etag(*parts) -> str:
+    """버전/경로 등으로부터 strong ETag 생성"""
+    raw = ":".join(str(p) for p in parts)
+    return '"' + hashlib.sha1(raw.encode()).hexdigest() + '"'
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match는 weak 비교 (W/ 접두사 무시)
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def etag_guard(*tables: str, per_user: bool = False, max_stale: Optional[int] = None):
+    """
+    조건부 GET dependency - 라우트에서 dependencies=[Depends(etag_guard(...))]로 opt-in
+    - ETag = 의존 테이블 버전 + 경로/쿼리 (+ 토큰, per_user일 때)
+    - If-None-Match가 일치하면 DB 조회 전에 304로 종료
+    - max_stale: 다른 worker의 쓰기는 버전에 잡히지 않으므로 ETag 유효 시간(초)을 제한
+    - 모든 테이블이 DB 버전이면 worker/재시작과 무관하게 같은 ETag (아니면 BOOT_ID로 구분)
+    """
+    scope = "db" if is_db_versioned(*tables) else BOOT_ID
+
+    # 순수 CPU 작업이라 threadpool을 거치지 않도록 async로 선언
+    async def dependency(request: Request, response: Response) -> str:
+        parts = [scope, request.url.path, request.url.query, get_version(*tables)]
+        if per_user:
+            parts.append(request.headers.get("authorization", ""))
+        if max_stale:
+            parts.append(int(time.time() // max_stale))
+        etag = make_etag(*parts)
+
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if per_user:
+            headers["Cache-Control"] = "private, no-cache"
+            headers["Vary"] = "Authorization"
+        if if_none_match(request, etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        request.state.etag_headers = headers
+        response.headers.update(headers)
+        return etag
+
+    return dependency
@@ -1,13 +1,22 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.gzip import GZipMiddleware
-from app.database import engine, Base
+from app.database import engine, Base, settings, check_replicas
 from app.models import (
     PCB, Case, Plate, Stabilizer, Switch, Keycap, CompatibleGroup,
     User, Build, BuildLike,
     Post, Comment, PostLike,
 )
-from app.routers import parts_router, auth_router, builds_router, community_router
+from app.routers import (
+    parts_router, auth_router, builds_router, community_router,
+    parts_async_router, builds_async_router, community_async_router,
+)
+from app.auth import password_pool
+from app.pagination import NEXT_CURSOR_HEADER
+from app.services.hot import refresh_all_hot_scores, hot_score_leader
+from app.services.likes import flush_like_counters
+from app.services.scheduler import PeriodicTask
+from app.services.versions import sync_db_versions
 
 # 서버 시작 시 테이블 생성
 Base.metadata.create_all(bind=engine)
@@ -29,13 +38,50 @@ app.add_middleware(
     allow_credentials=True, # 쿠키/인증 허용
     allow_methods=["*"], # 모든 HTTP method 허용
     allow_headers=["*"], # 모든 header 허용
+    expose_headers=[NEXT_CURSOR_HEADER], # 브라우저에서 다음 페이지 cursor 헤더 읽기 허용
 )
 
+# async 모드: 자주 호출되는 조회(카탈로그, 공개 빌드 피드, 게시글 목록)는 AsyncSession 기반 async 핸들러
+# - 같은 경로는 먼저 등록된 라우트가 처리하므로 sync router보다 먼저 등록
+# - 나머지 핸들러는 sync 그대로 threadpool에서 실행
+if settings.async_db:
+    app.include_router(parts_async_router)
+    app.include_router(builds_async_router)
+    app.include_router(community_async_router)
+
 app.include_router(parts_router)
 app.include_router(auth_router)
 app.include_router(builds_router)
 app.include_router(community_router)
 
+# 주기 작업 (worker마다 실행됨)
+# - table-version-sync: seed/마이그레이션 등 다른 프로세스의 부품 변경을 감지 (카탈로그/호환성/검색 캐시 갱신)
+# - like-counter-flush: 각 worker의 좋아요 증감 버퍼를 반영하므로 모든 worker에서 실행
+# - hot-score-refresh: 모든 worker에서 시작하지만 advisory lock을 잡은 한 프로세스만 실행
+#   (다른 worker의 프로세스 내 피드 캐시는 TTL 이내에 새 순서 반영)
+# - replica-health-check: replica 연결/복제 지연 확인 (요청 경로에서는 마지막 결과만 읽음)
+periodic_tasks = [
+    PeriodicTask("replica-health-check", settings.replica_check_interval_seconds, check_replicas),
+    PeriodicTask("table-version-sync", settings.table_version_poll_seconds, sync_db_versions),
+    PeriodicTask("like-counter-flush", settings.like_flush_interval_seconds, flush_like_counters),
+    PeriodicTask("hot-score-refresh", settings.hot_score_refresh_seconds, refresh_all_hot_scores),
+]
+
+@app.on_event("startup")
+def start_periodic_tasks():
+    sync_db_versions()  # 첫 요청부터 현재 부품 버전 사용
+    check_replicas()  # 확인 전 replica는 사용하지 않으므로 시작 시 한 번 확인
+    for task in periodic_tasks:
+        task.start()
+
+@app.on_event("shutdown")
+def shutdown_background_workers():
+    for task in periodic_tasks:
+        task.stop()
+    hot_score_leader.release()
+    flush_like_counters()  # 남은 좋아요 증감 반영
+    password_pool.shutdown()
+
 @app.get("/")
 def root():
     return {
@@ -3,9 +3,11 @@ from app.models.user import User
 from app.models.build import Build
 from app.models.build_like import BuildLike
 from app.models.community import Post, Comment, PostLike, PostCategory
+from app.models.table_version import TableVersion, DB_VERSIONED_TABLES, DB_VERSION_KEYS, USERS_DELETED
 
 __all__ = [
     "PCB", "Case", "Plate", "Stabilizer", "Switch", "Keycap", "CompatibleGroup",
     "User", "Build", "BuildLike",
     "Post", "Comment", "PostLike", "PostCategory",
+    "TableVersion", "DB_VERSIONED_TABLES", "DB_VERSION_KEYS", "USERS_DELETED",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Float, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -12,6 +12,7 @@ class Build(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     is_public = Column(Boolean, default=False)
     like_count = Column(Integer, default=0)
+    hot_score = Column(Float, default=0.0, server_default="0", nullable=False) # 인기순 정렬용, app.services.hot 참고
 
     pcb_id = Column(Integer, ForeignKey("pcbs.id"), nullable=True)
     case_id = Column(Integer, ForeignKey("cases.id"), nullable=True)
@@ -23,11 +24,18 @@ class Build(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_builds_is_public_hot_score_id", "is_public", "hot_score", "id"),
+        Index("ix_builds_user_id_updated_at_id", "user_id", "updated_at", "id"), # 내 빌드 목록 keyset
+    )
+
     user = relationship("User", back_populates="builds")
     likes = relationship("BuildLike", back_populates="build", cascade="all, delete-orphan")
-    pcb = relationship("PCB", lazy="joined")
-    case = relationship("Case", lazy="joined")
-    plate = relationship("Plate", lazy="joined")
-    stabilizer = relationship("Stabilizer", lazy="joined")
-    switch = relationship("Switch", lazy="joined")
-    keycap = relationship("Keycap", lazy="joined")
+    # 부품은 기본으로 로딩하지 않음 - 응답은 app.services.build_loader가 *_id로 일괄 조회
+    # 관계가 필요한 쿼리는 joinedload/selectinload를 명시 (명시 없이 접근하면 SQL 대신 예외)
+    pcb = relationship("PCB", lazy="raise_on_sql")
+    case = relationship("Case", lazy="raise_on_sql")
+    plate = relationship("Plate", lazy="raise_on_sql")
+    stabilizer = relationship("Stabilizer", lazy="raise_on_sql")
+    switch = relationship("Switch", lazy="raise_on_sql")
+    keycap = relationship("Keycap", lazy="raise_on_sql")
@@ -1,6 +1,7 @@
 import enum
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint, Enum
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy import Column, Integer, Float, String, Text, DateTime, ForeignKey, UniqueConstraint, Enum, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, backref, deferred
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -12,6 +13,10 @@ class PostCategory(str, enum.Enum):
     showcase = "showcase"
 
 
+# 검색용 tsvector - 한국어는 형태소 분석 사전이 없으므로 공백 단위 'simple' 설정 + 접두어 검색으로 조사 대응
+SEARCH_VECTOR_SQL = "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, ''))"
+
+
 class Post(Base):
     __tablename__ = "posts"
 
@@ -22,8 +27,21 @@ class Post(Base):
     content = Column(Text, nullable=False)
     category = Column(Enum(PostCategory), nullable=False)
     like_count = Column(Integer, default=0)
+    comment_count = Column(Integer, default=0, server_default="0", nullable=False) # 답글 포함, 댓글 작성/삭제 시 함께 갱신
+    hot_score = Column(Float, default=0.0, server_default="0", nullable=False) # 인기순 정렬용, app.services.hot 참고
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
+
+    # 목록 keyset 페이지네이션용 (정렬 키 순서와 동일, 역방향 scan으로 desc 정렬)
+    __table_args__ = (
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        Index("ix_posts_category_created_at_id", "category", "created_at", "id"),
+        Index("ix_posts_hot_score_id", "hot_score", "id"),
+        Index("ix_posts_category_hot_score_id", "category", "hot_score", "id"),
+        Index("ix_posts_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     user = relationship("User")
     build = relationship("Build")
@@ -41,6 +59,12 @@ class Comment(Base):
     content = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_comments_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_comments_post_id_parent_created_at_id", "post_id", "parent_comment_id", "created_at", "id"),
+        Index("ix_comments_parent_comment_id_created_at_id", "parent_comment_id", "created_at", "id"),
+    )
+
     user = relationship("User")
     post = relationship("Post", back_populates="comments")
     replies = relationship(
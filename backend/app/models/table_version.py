@@ -0,0 +1,70 @@
+from sqlalchemy import BigInteger, Column, String, event, text
+from app.database import Base
+from app.models.parts import PCB, Case, Plate, Stabilizer, Switch, Keycap, CompatibleGroup
+from app.models.user import User
+
+# 버전을 DB(table_versions)에 두는 테이블
+# - 부품 테이블은 API가 아닌 seed/마이그레이션 등 다른 프로세스에서 바뀌므로 프로세스 내 카운터로는 감지 불가
+# - PostgreSQL trigger가 같은 트랜잭션에서 버전을 올림 -> 어떤 경로로 바뀌어도 모든 worker가 같은 값을 봄
+DB_VERSIONED_TABLES = (
+    PCB.__tablename__, Case.__tablename__, Plate.__tablename__,
+    Stabilizer.__tablename__, Switch.__tablename__, Keycap.__tablename__,
+    CompatibleGroup.__tablename__,
+)
+
+# 탈퇴(users DELETE) 횟수 - 모든 worker의 인증 사용자 캐시 무효화용
+# (users 테이블 자체의 버전과는 별개, 닉네임 변경 등은 올리지 않음)
+USERS_DELETED = "users_deleted"
+
+# table_versions에서 읽는 key 전체
+DB_VERSION_KEYS = DB_VERSIONED_TABLES + (USERS_DELETED,)
+
+
+class TableVersion(Base):
+    __tablename__ = "table_versions"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
+BUMP_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES (COALESCE(TG_ARGV[0], TG_TABLE_NAME), 1)
+    ON CONFLICT (table_name) DO UPDATE SET version = table_versions.version + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# 이미 있으면 건너뜀 (DROP/CREATE는 대상 테이블에 배타 lock을 잡으므로 worker 시작마다 하지 않음)
+BUMP_TRIGGER_SQL = """
+DO $$ BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = '{name}') THEN
+        CREATE TRIGGER {name}
+        AFTER {events} ON {table}
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version({args});
+    END IF;
+END $$
+"""
+
+# (trigger 이름, 테이블, 이벤트, table_versions key - 비어 있으면 테이블 이름)
+VERSION_TRIGGERS = [
+    *(
+        (f"trg_{table}_version", table, "INSERT OR UPDATE OR DELETE OR TRUNCATE", "")
+        for table in DB_VERSIONED_TABLES
+    ),
+    (f"trg_{USERS_DELETED}_version", User.__tablename__, "DELETE", f"'{USERS_DELETED}'"),
+]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def install_version_triggers(metadata, connection, **kw):
+    """create_all 때마다 실행 (테이블이 이미 있어도 호출됨) - trigger가 없으면 설치"""
+    if connection.dialect.name != "postgresql":
+        return
+    # 여러 worker가 동시에 시작할 때 CREATE OR REPLACE FUNCTION 충돌 방지 (트랜잭션 끝나면 해제)
+    connection.execute(text("SELECT pg_advisory_xact_lock(hashtext('table_versions'))"))
+    connection.execute(text(BUMP_FUNCTION_SQL))
+    for name, table, events, args in VERSION_TRIGGERS:
+        connection.execute(text(BUMP_TRIGGER_SQL.format(name=name, table=table, events=events, args=args)))
@@ -0,0 +1,78 @@
+import base64
+import json
+from datetime import datetime
+from typing import Callable, List, Optional, Sequence
+
+import sqlalchemy as sa
+from fastapi import HTTPException, Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence) -> str:
+    """정렬 키 값 목록 -> 불투명한 cursor 문자열 (datetime은 ISO 문자열로 저장)"""
+    raw = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(raw, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Callable) -> list:
+    """cursor -> 정렬 키 값 목록, types로 각 값을 원래 타입으로 복원"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(types):
+            raise ValueError("cursor length mismatch")
+        return [cast(v) for cast, v in zip(types, raw)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def keyset_paginate(query, key: Sequence[tuple], cursor: Optional[str], limit: int, descending: bool = True):
+    """
+    key [(column, 타입 변환 함수), ...] 기준 keyset 페이지네이션
+    - 정렬: key의 column 모두 desc (descending=False면 모두 asc), 마지막 column은 유일해야 함 (보통 id)
+    - cursor가 있으면 row value 비교 (c1, c2, ...) < (v1, v2, ...)로 이어서 조회
+      -> 같은 순서의 복합 인덱스를 range scan 하므로 깊은 페이지도 비용이 같음
+    - limit + 1개를 가져와 다음 페이지 존재 여부 판단
+    """
+    columns = [column for column, _ in key]
+    if cursor:
+        values = decode_cursor(cursor, *[cast for _, cast in key])
+        row, after = sa.tuple_(*columns), sa.tuple_(*values)
+        query = query.filter(row < after if descending else row > after)
+    order = [c.desc() if descending else c.asc() for c in columns]
+    return query.order_by(*order).limit(limit + 1)
+
+
+def cursor_for(obj, key: Sequence[tuple]) -> str:
+    """obj 다음부터 이어서 조회하는 cursor"""
+    return encode_cursor([getattr(obj, column.key) for column, _ in key])
+
+
+def split_page(
+    rows: List,
+    limit: int,
+    key: Sequence[tuple],
+    entity: Callable = lambda row: row,
+    values: Optional[Callable] = None,
+) -> tuple:
+    """
+    limit + 1개 조회 결과 -> (페이지, 다음 cursor 또는 None)
+    - 기본: entity(row)에서 key column 이름으로 값을 읽음
+    - 정렬 키에 계산식이 있으면 values(row)로 key 순서의 값 목록을 직접 반환
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    if values is not None:
+        return page, encode_cursor(values(page[-1]))
+    return page, cursor_for(entity(page[-1]), key)
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]):
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
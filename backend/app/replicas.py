@@ -0,0 +1,113 @@
+import itertools
+import logging
+from typing import List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select, CompoundSelect
+
+logger = logging.getLogger(__name__)
+
+# replica에서 복제 지연(초) 확인 - primary(복구 모드 아님)거나 WAL을 모두 반영했으면 0
+LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class Replica:
+    def __init__(self, engine: Engine, check_engine: Optional[Engine] = None):
+        self.engine = engine
+        # health check용 sync engine (async engine은 event loop 밖의 스레드에서 쓸 수 없으므로 별도 지정)
+        self.check_engine = check_engine or engine
+        self.healthy = False  # 첫 확인 전에는 primary 사용
+        self.lag = 0.0
+
+        # 연결이 끊기면 다음 health check까지 기다리지 않고 바로 제외
+        @event.listens_for(engine, "handle_error")
+        def _on_error(context):
+            if context.is_disconnect:
+                self.mark_down()
+
+    def mark_down(self):
+        self.healthy = False
+
+    def check(self, max_lag: float):
+        try:
+            with self.check_engine.connect() as conn:
+                self.lag = float(conn.execute(LAG_QUERY).scalar() or 0)
+            self.healthy = self.lag <= max_lag
+            if not self.healthy:
+                logger.warning("replica %s lagging %.1fs, falling back", self.engine.url.host, self.lag)
+        except Exception:
+            logger.warning("replica %s health check failed", self.engine.url.host, exc_info=True)
+            self.healthy = False
+
+
+class ReplicaSet:
+    """
+    read replica 풀
+    - check_all()이 연결/복제 지연 확인 (주기 작업 스레드에서 실행, 요청 경로에서는 확인하지 않음)
+    - choose()는 마지막 확인 결과만 읽음 -> 느리거나 죽은 replica가 요청 지연에 더해지지 않음
+    - 지연이 max_lag를 넘거나 연결 실패한 replica는 제외, 모두 제외되면 None (primary 사용)
+    """
+
+    def __init__(
+        self,
+        engines: List[Engine],
+        max_lag: float = 5.0,
+        check_engines: Optional[List[Engine]] = None,
+    ):
+        check_engines = check_engines or [None] * len(engines)
+        self.replicas = [Replica(e, c) for e, c in zip(engines, check_engines)]
+        self.max_lag = max_lag
+        self._round_robin = itertools.count()
+
+    def __bool__(self):
+        return bool(self.replicas)
+
+    def check_all(self):
+        for replica in self.replicas:
+            replica.check(self.max_lag)
+
+    def choose(self) -> Optional[Engine]:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._round_robin) % len(healthy)].engine
+
+
+class RoutingSession(Session):
+    """
+    read-only 요청의 SELECT는 replica로, 나머지는 primary로 보내는 세션
+    - info["read_only"]: get_db가 GET/HEAD 요청에서 설정
+    - 한 번이라도 primary에 쓰기(flush/DML)를 하면 이후 읽기도 primary (read-your-writes)
+    - replica는 세션의 첫 조회 때 고르고 이후 조회도 같은 replica 사용
+    """
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            self.replicas
+            and self.info.get("read_only")
+            and not self.info.get("wrote")
+            and not self._flushing
+            and isinstance(clause, (Select, CompoundSelect))
+            and clause._for_update_arg is None
+        ):
+            # 세션마다 replica 하나로 고정 (한 요청의 조회들이 같은 시점의 데이터를 보도록)
+            if "replica" not in self.info:
+                self.info["replica"] = self.replicas.choose()
+            replica = self.info["replica"]
+            if replica is not None:
+                return replica
+
+        if self._flushing or (clause is not None and clause.is_dml):
+            self.info["wrote"] = True
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
@@ -0,0 +1,58 @@
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from pydantic_core import SchemaSerializer
+
+
+class FastJSONResponse(Response):
+    """이미 JSON bytes로 직렬화된 본문 그대로 응답"""
+    media_type = "application/json"
+
+
+def _as_typed_dict(schema: Any) -> Any:
+    """
+    pydantic core schema의 model 노드를 같은 필드의 typed-dict 노드로 변환
+    - 결과 serializer는 dict를 받아 schema에 선언된 필드만 출력 (나머지 key는 무시)
+    - ref는 유지하므로 재귀 모델(CommentResponse.replies 등)도 그대로 동작
+    """
+    if isinstance(schema, list):
+        return [_as_typed_dict(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    if schema.get("type") == "model":
+        fields = {}
+        for name, field in schema["schema"]["fields"].items():
+            typed_field = {"type": "typed-dict-field", "schema": _as_typed_dict(field["schema"]), "required": True}
+            for key in ("serialization_alias", "serialization_exclude"):
+                if key in field:
+                    typed_field[key] = field[key]
+            fields[name] = typed_field
+        typed = {"type": "typed-dict", "fields": fields}
+        if "ref" in schema:
+            typed["ref"] = schema["ref"]
+        return typed
+    return {key: _as_typed_dict(value) for key, value in schema.items()}
+
+
+class ResponseSerializer:
+    """
+    response_model 타입에서 미리 만든 JSON serializer
+    - 라우트가 직접 만든(신뢰하는) dict/list를 검증 없이 바로 JSON bytes로 변환
+      (FastAPI 기본 경로는 반환값을 response_model로 다시 검증한 뒤 직렬화)
+    - 출력 필드/형식(datetime, Enum 등)은 response_model 검증 경로와 같음
+    - 반환한 Response는 FastAPI가 그대로 사용하므로 response_model은 문서용으로만 남음
+    """
+
+    def __init__(self, tp: Any):
+        self.serializer = SchemaSerializer(_as_typed_dict(TypeAdapter(tp).core_schema))
+
+    def to_json(self, content: Any) -> bytes:
+        return self.serializer.to_json(content, warnings=False)
+
+    def response(self, content: Any, response: Optional[Response] = None, status_code: int = 200) -> FastJSONResponse:
+        """response: 라우트에 주입된 Response (X-Next-Cursor 등 설정한 헤더를 옮김)"""
+        headers = None
+        if response is not None:
+            headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+        return FastJSONResponse(content=self.to_json(content), status_code=status_code, headers=headers)
@@ -1,6 +1,9 @@
-from app.routers.parts import router as parts_router
+from app.routers.parts import router as parts_router, async_router as parts_async_router
 from app.routers.auth import router as auth_router
-from app.routers.builds import router as builds_router
-from app.routers.community import router as community_router
+from app.routers.builds import router as builds_router, async_router as builds_async_router
+from app.routers.community import router as community_router, async_router as community_async_router
 
-__all__ = ["parts_router", "auth_router", "builds_router", "community_router"]
+__all__ = [
+    "parts_router", "auth_router", "builds_router", "community_router",
+    "parts_async_router", "builds_async_router", "community_async_router",
+]
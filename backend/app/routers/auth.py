@@ -4,7 +4,8 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.user import User
 from app.schemas.auth import UserCreate, UserLogin, UserResponse, TokenResponse, UserUpdate, PasswordChange
-from app.auth import hash_password, verify_password, create_access_token, get_current_user
+from app.auth import hash_password, verify_password, create_access_token, get_current_user, user_cache
+from app.services.feed_cache import build_feed_cache
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
@@ -61,11 +62,15 @@ def update_profile(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    user_id = current_user.id
     update_data = data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(current_user, key, value)
 
     db.commit()
+    user_cache.invalidate(user_id)
+    if "nickname" in update_data:
+        build_feed_cache.invalidate()  # 피드에 닉네임 포함
     db.refresh(current_user)
     return current_user
 
@@ -76,7 +81,9 @@ def change_password(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    if not verify_password(data.current_password, current_user.hashed_password):
+    # current_user는 캐시에서 온 값일 수 있으므로 hash는 항상 DB에서 읽음
+    hashed_password = db.query(User.hashed_password).filter(User.id == current_user.id).scalar()
+    if hashed_password is None or not verify_password(data.current_password, hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
@@ -88,8 +95,10 @@ def change_password(
             detail="New password must be at least 6 characters",
         )
 
+    user_id = current_user.id
     current_user.hashed_password = hash_password(data.new_password)
     db.commit()
+    user_cache.invalidate(user_id)
     return {"message": "Password changed successfully"}
 
 
@@ -98,5 +107,8 @@ def delete_account(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    user_id = current_user.id
     db.delete(current_user)
     db.commit()
+    user_cache.invalidate(user_id)
+    build_feed_cache.invalidate()
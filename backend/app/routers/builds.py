@@ -1,99 +1,210 @@
-from typing import List, Optional
+import json
+from typing import List, Literal, Optional, Set, Tuple
 
 import sqlalchemy as sa
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, load_only
 
-from app.database import get_db
-from app.auth import get_current_user, get_optional_user
+from app.database import get_db, get_async_db, run_in_session
+from app.auth import get_current_user, get_current_user_id, get_optional_user_id
 from app.models.user import User
 from app.models.build import Build
 from app.models.build_like import BuildLike
-from app.models.parts import PCB, Case, Plate
 from app.schemas.build import (
     BuildCreate, BuildUpdate, BuildListItem, BuildResponse,
     PublicBuildResponse, LikeResponse,
 )
+from app.services.build_loader import BUILD_PART_SLOTS, serialize_builds
+from app.services.catalog import PART_TABLES
+from app.services.feed_cache import build_feed_cache
+from app.services.hot import decay_weight
+from app.services.likes import build_like_counter, liked_build_ids, resolve_liked_ids_async, toggle_like
+from app.etag import etag_guard
+from app.pagination import keyset_paginate, split_page, set_next_cursor, parse_datetime
+from app.responses import FastJSONResponse, ResponseSerializer
 
 router = APIRouter(prefix="/api/builds", tags=["builds"])
+# async 모드에서 router보다 먼저 등록되는 async 핸들러 (같은 경로를 대체)
+async_router = APIRouter(prefix="/api/builds", tags=["builds"])
 
+# 공개 빌드 피드: 빌드/좋아요/닉네임/부품 변경 시 ETag 갱신, is_liked 때문에 사용자별
+public_builds_etag = [Depends(etag_guard(
+    Build.__tablename__, BuildLike.__tablename__, User.__tablename__, *PART_TABLES,
+    per_user=True, max_stale=30,
+))]
 
-def _serialize_part_with_group(obj):
-    if obj is None:
-        return None
-    data = {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
-    if hasattr(obj, "compatible_group") and obj.compatible_group:
-        data["compatible_group_name"] = obj.compatible_group.name
-    else:
-        data["compatible_group_name"] = None
-    return data
-
-
-def _serialize_part(obj):
-    if obj is None:
-        return None
-    return {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
-
-
-def _serialize_build(build: Build) -> dict:
-    return {
-        "id": build.id,
-        "name": build.name,
-        "user_id": build.user_id,
-        "is_public": build.is_public,
-        "like_count": build.like_count,
-        "created_at": build.created_at,
-        "updated_at": build.updated_at,
-        "pcb": _serialize_part_with_group(build.pcb),
-        "case": _serialize_part_with_group(build.case),
-        "plate": _serialize_part_with_group(build.plate),
-        "stabilizer": _serialize_part(build.stabilizer),
-        "switch": _serialize_part(build.switch),
-        "keycap": _serialize_part(build.keycap),
-    }
-
-
-def _serialize_public_build(build: Build, is_liked: bool = False) -> dict:
-    result = _serialize_build(build)
-    result["user_nickname"] = build.user.nickname if build.user else None
-    result["is_liked"] = is_liked
-    return result
+# 쓰기 경로(INSERT/UPDATE ... RETURNING)용 Core 테이블
+BUILDS = Build.__table__
+
+
+def _serialize_build(db: Session, build: Build) -> dict:
+    return serialize_builds(db, [build])[0]
+
+
+def _serialize_public_builds(db: Session, builds: List[Build]) -> List[dict]:
+    payloads = serialize_builds(db, builds)
+    for build, payload in zip(builds, payloads):
+        payload["user_nickname"] = build.user.nickname if build.user else None
+        payload["is_liked"] = False
+    return payloads
 
 
 # --- Public endpoints (before /{build_id}) ---
 
-@router.get("/popular", response_model=List[PublicBuildResponse])
-def get_popular_builds(
-    limit: int = 8,
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
-):
-    builds = (
+# 내 빌드 목록: 최근 수정 순 keyset (user_id, updated_at, id 인덱스), 다음 페이지 cursor는 X-Next-Cursor 헤더
+MY_BUILD_KEY = ((Build.updated_at, parse_datetime), (Build.id, int))
+PART_SLOT_NAMES = tuple(slot for slot, _, _ in BUILD_PART_SLOTS)
+# BuildListItem에 필요한 컬럼만 조회 (부품은 id 유무만 사용)
+MY_BUILD_COLUMNS = (
+    Build.id, Build.name, Build.is_public, Build.created_at, Build.updated_at,
+    *(getattr(Build, f"{slot}_id") for slot in PART_SLOT_NAMES),
+)
+
+# 라우트에서 만든 dict를 검증 없이 바로 JSON으로 직렬화 (app.responses)
+build_serializer = ResponseSerializer(BuildResponse)
+build_list_serializer = ResponseSerializer(List[BuildListItem])
+public_build_serializer = ResponseSerializer(PublicBuildResponse)
+
+
+def _popular_builds(db: Session, limit: int) -> List[Build]:
+    return (
         _load_public_builds_query(db)
         .filter(Build.is_public == True)
-        .order_by(Build.like_count.desc(), Build.created_at.desc())
+        .order_by(Build.hot_score.desc(), Build.id.desc())
         .limit(limit)
         .all()
     )
-    liked_ids = _get_liked_build_ids(db, current_user)
-    return [_serialize_public_build(b, b.id in liked_ids) for b in builds]
 
 
-@router.get("/recent", response_model=List[PublicBuildResponse])
-def get_recent_builds(
-    limit: int = 8,
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
-):
-    builds = (
+def _recent_builds(db: Session, limit: int) -> List[Build]:
+    return (
         _load_public_builds_query(db)
         .filter(Build.is_public == True)
         .order_by(Build.created_at.desc())
         .limit(limit)
         .all()
     )
-    liked_ids = _get_liked_build_ids(db, current_user)
-    return [_serialize_public_build(b, b.id in liked_ids) for b in builds]
+
+
+PUBLIC_FEEDS = {"popular": _popular_builds, "recent": _recent_builds}
+
+
+# 피드 캐시 값 = 좋아요 위치 header 한 줄 + b"\n" + 익명 기준(is_liked=False) JSON 본문
+_IS_LIKED_FALSE = b'"is_liked":false'
+_IS_LIKED_VALUE = len(b'"is_liked":')
+
+
+def _encode_public_feed(items: List[dict]) -> bytes:
+    """
+    항목별로 직렬화해서 이어 붙이면서 각 항목 is_liked 값(false)의 본문 내 위치를 기록
+    - header: [[build id, 위치], ...] (JSON 문자열 안의 따옴표는 escape되므로 key로만 일치)
+    """
+    chunks, marks, offset = [], [], 1  # 본문 첫 글자는 "["
+    for item in items:
+        encoded = public_build_serializer.to_json(item)
+        marks.append([item["id"], offset + encoded.rindex(_IS_LIKED_FALSE) + _IS_LIKED_VALUE])
+        chunks.append(encoded)
+        offset += len(encoded) + 1  # 항목 사이 ","
+    return json.dumps(marks, separators=(",", ":")).encode() + b"\n[" + b",".join(chunks) + b"]"
+
+
+def _public_feed_value(db: Session, feed: str, limit: int) -> Tuple[bytes, bytes]:
+    """(좋아요 위치 header, 익명 기준 본문) - build_feed_cache에 저장해 두고 사용"""
+    value = build_feed_cache.get_or_load(
+        f"{feed}:{limit}:marked",
+        lambda: _encode_public_feed(_serialize_public_builds(db, PUBLIC_FEEDS[feed](db, limit))),
+    )
+    header, _, body = value.partition(b"\n")
+    return header, body
+
+
+def _liked_feed_body(marks: List[list], body: bytes, liked_ids: Set[int]) -> bytes:
+    """좋아요한 항목의 false만 true로 바꾼 본문 (본문은 파싱하지 않고 bytes 이어 붙이기)"""
+    chunks, start = [], 0
+    for build_id, position in marks:
+        if build_id in liked_ids:
+            chunks += [body[start:position], b"true"]
+            start = position + len(b"false")
+    chunks.append(body[start:])
+    return b"".join(chunks)
+
+
+def _feed_response(request: Request, body: bytes) -> Response:
+    return FastJSONResponse(content=body, headers=request.state.etag_headers)
+
+
+def _public_feed_response(request: Request, db: Session, current_user_id: Optional[int], feed: str, limit: int) -> Response:
+    """
+    공개 빌드 피드 응답
+    - 익명 기준 JSON을 그대로 응답
+    - 로그인 사용자는 캐시된 목록의 id로 좋아요 여부만 조회해서 본문 bytes에 덧씌움
+    """
+    header, body = _public_feed_value(db, feed, limit)
+    if current_user_id is None:
+        return _feed_response(request, body)
+
+    marks = json.loads(header)
+    liked_ids = liked_build_ids(db, current_user_id, [build_id for build_id, _ in marks])
+    return _feed_response(request, _liked_feed_body(marks, body, liked_ids))
+
+
+async def _public_feed_response_async(
+    request: Request, db: AsyncSession, current_user_id: Optional[int], feed: str, limit: int,
+) -> Response:
+    """
+    async 모드 공개 빌드 피드
+    - 캐시 조회(Redis client는 blocking)와 미스 시 생성/직렬화는 threadpool의 sync 세션에서
+    - 로그인 사용자의 좋아요 여부 조회만 AsyncSession으로 await
+    """
+    header, body = await run_in_threadpool(run_in_session, _public_feed_value, feed, limit)
+    if current_user_id is None:
+        return _feed_response(request, body)
+
+    marks = json.loads(header)
+    liked_ids = await resolve_liked_ids_async(db, BuildLike.build_id, current_user_id, [build_id for build_id, _ in marks])
+    return _feed_response(request, _liked_feed_body(marks, body, liked_ids))
+
+
+@router.get("/popular", response_model=List[PublicBuildResponse], dependencies=public_builds_etag)
+def get_popular_builds(
+    request: Request,
+    limit: int = Query(8, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user_id: Optional[int] = Depends(get_optional_user_id),
+):
+    return _public_feed_response(request, db, current_user_id, "popular", limit)
+
+
+@router.get("/recent", response_model=List[PublicBuildResponse], dependencies=public_builds_etag)
+def get_recent_builds(
+    request: Request,
+    limit: int = Query(8, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user_id: Optional[int] = Depends(get_optional_user_id),
+):
+    return _public_feed_response(request, db, current_user_id, "recent", limit)
+
+
+@async_router.get("/popular", response_model=List[PublicBuildResponse], dependencies=public_builds_etag)
+async def get_popular_builds_async(
+    request: Request,
+    limit: int = Query(8, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: Optional[int] = Depends(get_optional_user_id),
+):
+    return await _public_feed_response_async(request, db, current_user_id, "popular", limit)
+
+
+@async_router.get("/recent", response_model=List[PublicBuildResponse], dependencies=public_builds_etag)
+async def get_recent_builds_async(
+    request: Request,
+    limit: int = Query(8, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: Optional[int] = Depends(get_optional_user_id),
+):
+    return await _public_feed_response_async(request, db, current_user_id, "recent", limit)
 
 
 # --- Authenticated endpoints ---
@@ -104,66 +215,83 @@ def create_build(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    build = Build(
-        name=data.name,
-        user_id=current_user.id,
-        is_public=data.is_public,
-        pcb_id=data.pcb_id,
-        case_id=data.case_id,
-        plate_id=data.plate_id,
-        stabilizer_id=data.stabilizer_id,
-        switch_id=data.switch_id,
-        keycap_id=data.keycap_id,
-    )
-    db.add(build)
+    # INSERT ... RETURNING으로 저장과 동시에 행을 받아 직렬화 (commit 후 refresh/재조회 없음)
+    build = db.execute(
+        sa.insert(BUILDS).values(
+            name=data.name,
+            user_id=current_user.id,
+            is_public=data.is_public,
+            pcb_id=data.pcb_id,
+            case_id=data.case_id,
+            plate_id=data.plate_id,
+            stabilizer_id=data.stabilizer_id,
+            switch_id=data.switch_id,
+            keycap_id=data.keycap_id,
+        ).returning(*BUILDS.c)
+    ).one()
     db.commit()
-    db.refresh(build)
+    if build.is_public:
+        build_feed_cache.invalidate()
 
-    build = _load_build_with_relations(db, build.id)
-    return _serialize_build(build)
+    return build_serializer.response(_serialize_build(db, build), status_code=status.HTTP_201_CREATED)
 
 
 @router.get("", response_model=List[BuildListItem])
 def get_builds(
+    response: Response,
+    is_public: Optional[bool] = None,
+    has_part: List[Literal[PART_SLOT_NAMES]] = Query(None),
+    missing_part: List[Literal[PART_SLOT_NAMES]] = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
 ):
-    builds = (
+    """
+    내 빌드 목록 (최근 수정 순, cursor 페이지네이션)
+    - is_public: 공개/비공개만
+    - has_part / missing_part: 해당 부품이 선택된/비어 있는 빌드만 (여러 번 지정하면 모두 만족)
+    """
+    query = (
         db.query(Build)
-        .filter(Build.user_id == current_user.id)
-        .order_by(Build.updated_at.desc())
-        .all()
+        .options(load_only(*MY_BUILD_COLUMNS))
+        .filter(Build.user_id == current_user_id)
     )
-    return [
+    if is_public is not None:
+        query = query.filter(Build.is_public == is_public)
+    for slot in has_part or ():
+        query = query.filter(getattr(Build, f"{slot}_id").isnot(None))
+    for slot in missing_part or ():
+        query = query.filter(getattr(Build, f"{slot}_id").is_(None))
+
+    query = keyset_paginate(query, MY_BUILD_KEY, cursor, limit)
+    builds, next_cursor = split_page(query.all(), limit, MY_BUILD_KEY)
+    set_next_cursor(response, next_cursor)
+    return build_list_serializer.response([
         {
             "id": b.id,
             "name": b.name,
             "is_public": b.is_public,
             "created_at": b.created_at,
             "updated_at": b.updated_at,
-            "has_pcb": b.pcb_id is not None,
-            "has_case": b.case_id is not None,
-            "has_plate": b.plate_id is not None,
-            "has_stabilizer": b.stabilizer_id is not None,
-            "has_switch": b.switch_id is not None,
-            "has_keycap": b.keycap_id is not None,
+            **{f"has_{slot}": getattr(b, f"{slot}_id") is not None for slot in PART_SLOT_NAMES},
         }
         for b in builds
-    ]
+    ], response)
 
 
 @router.get("/{build_id}", response_model=BuildResponse)
 def get_build(
     build_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
 ):
-    build = _load_build_with_relations(db, build_id)
+    build = _load_build(db, build_id)
     if not build:
         raise HTTPException(status_code=404, detail="Build not found")
-    if build.user_id != current_user.id:
+    if build.user_id != current_user_id:
         raise HTTPException(status_code=403, detail="Not authorized")
-    return _serialize_build(build)
+    return build_serializer.response(_serialize_build(db, build))
 
 
 @router.put("/{build_id}", response_model=BuildResponse)
@@ -173,21 +301,28 @@ def update_build(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    build = db.query(Build).filter(Build.id == build_id).first()
-    if not build:
-        raise HTTPException(status_code=404, detail="Build not found")
-    if build.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
+    # 소유자 조건을 건 UPDATE ... RETURNING 한 번으로 수정 + 응답용 행 조회
     update_data = data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(build, key, value)
+    if not update_data:
+        update_data = {"updated_at": BUILDS.c.updated_at}  # 변경 없음: 행만 반환
+    build = db.execute(
+        sa.update(BUILDS)
+        .where(BUILDS.c.id == build_id, BUILDS.c.user_id == current_user.id)
+        .values(**update_data)
+        .returning(*BUILDS.c)
+    ).first()
+    if build is None:
+        # 갱신된 행이 없을 때만 404/403 구분용 조회
+        if db.query(Build.id).filter(Build.id == build_id).first() is None:
+            raise HTTPException(status_code=404, detail="Build not found")
+        raise HTTPException(status_code=403, detail="Not authorized")
 
     db.commit()
-    db.refresh(build)
+    # 공개 빌드 수정, 공개 여부 변경 시 피드 무효화 (이전 공개 여부는 RETURNING으로 알 수 없음)
+    if build.is_public or "is_public" in update_data:
+        build_feed_cache.invalidate()
 
-    build = _load_build_with_relations(db, build.id)
-    return _serialize_build(build)
+    return build_serializer.response(_serialize_build(db, build))
 
 
 @router.delete("/{build_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -202,8 +337,11 @@ def delete_build(
     if build.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
 
+    was_public = build.is_public
     db.delete(build)
     db.commit()
+    if was_public:
+        build_feed_cache.invalidate()
 
 
 @router.post("/{build_id}/like", response_model=LikeResponse)
@@ -212,74 +350,27 @@ def toggle_build_like(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    build = db.query(Build).filter(Build.id == build_id, Build.is_public == True).first()
-    if not build:
+    result = toggle_like(db, BuildLike.build_id, current_user.id, build_id, Build.is_public == True)
+    if result is None:
         raise HTTPException(status_code=404, detail="Build not found")
+    db.commit()
 
-    existing = (
-        db.query(BuildLike)
-        .filter(BuildLike.user_id == current_user.id, BuildLike.build_id == build_id)
-        .first()
+    # like_count는 write-behind 버퍼에 모았다가 주기적으로 반영 (app.services.likes)
+    # 피드 캐시는 반영 시점에 무효화 (is_liked는 캐시하지 않으므로 본인 화면에는 바로 반영)
+    if result.delta:
+        build_like_counter.add(build_id, result.delta, decay_weight(result.created_at))
+    return LikeResponse(
+        liked=result.liked,
+        like_count=max(0, result.like_count + build_like_counter.pending(build_id)),
     )
 
-    if existing:
-        db.delete(existing)
-        db.execute(
-            sa.update(Build)
-            .where(Build.id == build_id)
-            .values(like_count=sa.func.greatest(0, Build.like_count - 1))
-        )
-        liked = False
-    else:
-        like = BuildLike(user_id=current_user.id, build_id=build_id)
-        db.add(like)
-        db.execute(
-            sa.update(Build)
-            .where(Build.id == build_id)
-            .values(like_count=Build.like_count + 1)
-        )
-        liked = True
-
-    db.commit()
-    db.refresh(build)
-    return LikeResponse(liked=liked, like_count=build.like_count)
-
 
 # --- Helper functions ---
 
-def _load_build_with_relations(db: Session, build_id: int) -> Build:
-    return (
-        db.query(Build)
-        .options(
-            joinedload(Build.pcb).joinedload(PCB.compatible_group),
-            joinedload(Build.case).joinedload(Case.compatible_group),
-            joinedload(Build.plate).joinedload(Plate.compatible_group),
-            joinedload(Build.stabilizer),
-            joinedload(Build.switch),
-            joinedload(Build.keycap),
-        )
-        .filter(Build.id == build_id)
-        .first()
-    )
+def _load_build(db: Session, build_id: int) -> Build:
+    # 부품은 serialize_builds가 id로 조회 (대부분 part_payload_cache에서 처리)
+    return db.query(Build).filter(Build.id == build_id).first()
 
 
 def _load_public_builds_query(db: Session):
-    return (
-        db.query(Build)
-        .options(
-            joinedload(Build.user),
-            joinedload(Build.pcb).joinedload(PCB.compatible_group),
-            joinedload(Build.case).joinedload(Case.compatible_group),
-            joinedload(Build.plate).joinedload(Plate.compatible_group),
-            joinedload(Build.stabilizer),
-            joinedload(Build.switch),
-            joinedload(Build.keycap),
-        )
-    )
-
-
-def _get_liked_build_ids(db: Session, user: Optional[User]) -> set:
-    if user is None:
-        return set()
-    likes = db.query(BuildLike.build_id).filter(BuildLike.user_id == user.id).all()
-    return {like.build_id for like in likes}
+    return db.query(Build).options(joinedload(Build.user))
@@ -1,16 +1,24 @@
 from typing import List, Optional
 
 import sqlalchemy as sa
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import func as sa_func
-from sqlalchemy.orm import Session, joinedload, subqueryload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased, joinedload
 
-from app.database import get_db
-from app.auth import get_current_user, get_optional_user
+from app.database import get_db, get_async_db, run_in_session
+from app.auth import get_current_user, get_current_user_id, get_optional_user_id
 from app.models.user import User
 from app.models.build import Build
-from app.models.parts import PCB, Case, Plate
 from app.models.community import Post, Comment, PostLike, PostCategory
+from app.services.build_loader import load_build_payloads
+from app.services.feed_cache import build_feed_cache
+from app.services.hot import decay_weight
+from app.services.search import prefix_tsquery, search_rank, to_tsquery
+from app.services.likes import post_like_counter, liked_post_ids, resolve_liked_ids_async, toggle_like
+from app.pagination import keyset_paginate, split_page, cursor_for, set_next_cursor, parse_datetime
+from app.responses import ResponseSerializer
 from app.schemas.community import (
     PostCreate, PostUpdate, PostListItem, PostResponse, PostAuthor,
     CommentCreate, CommentResponse, CommentAuthor, PostLikeResponse,
@@ -18,265 +26,346 @@ from app.schemas.community import (
 )
 
 router = APIRouter(prefix="/api/community", tags=["community"])
+# async 모드에서 router보다 먼저 등록되는 async 핸들러 (같은 경로를 대체)
+async_router = APIRouter(prefix="/api/community", tags=["community"])
 
+# keyset 정렬 키 (모두 desc) - 다음 페이지 cursor는 X-Next-Cursor 헤더로 전달
+RECENT_POST_KEY = ((Post.created_at, parse_datetime), (Post.id, int))
+POPULAR_POST_KEY = ((Post.hot_score, float), (Post.id, int))
+COMMENT_KEY = ((Comment.created_at, parse_datetime), (Comment.id, int))
 
+# 댓글 스레드: 게시글 상세/댓글 목록은 첫 페이지만, 답글은 앞부분 미리보기만 포함 (나머지는 cursor로 조회)
+COMMENT_PAGE_SIZE = 20
+REPLY_PREVIEW_SIZE = 3
 
-
-def _serialize_part_with_group(obj):
-    if obj is None:
-        return None
-    data = {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
-    if hasattr(obj, "compatible_group") and obj.compatible_group:
-        data["compatible_group_name"] = obj.compatible_group.name
-    else:
-        data["compatible_group_name"] = None
-    return data
+# 조회 응답은 라우트에서 만든 dict를 검증 없이 바로 JSON으로 직렬화 (app.responses)
+post_list_serializer = ResponseSerializer(List[PostListItem])
+post_serializer = ResponseSerializer(PostResponse)
+comment_list_serializer = ResponseSerializer(List[CommentResponse])
+my_comment_list_serializer = ResponseSerializer(List[MyCommentResponse])
 
 
-def _serialize_part(obj):
-    if obj is None:
+def _get_build_data(db: Session, post: Post) -> Optional[dict]:
+    if not post.build_id:
         return None
-    return {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
+    return load_build_payloads(db, [post.build_id]).get(post.build_id)
 
 
-def _serialize_build(build: Build) -> dict:
+def _build_post_list_item(post, is_liked: bool, author: dict, build: Optional[dict]) -> dict:
     return {
-        "id": build.id,
-        "name": build.name,
-        "user_id": build.user_id,
-        "is_public": build.is_public,
-        "like_count": build.like_count,
-        "created_at": build.created_at,
-        "updated_at": build.updated_at,
-        "pcb": _serialize_part_with_group(build.pcb),
-        "case": _serialize_part_with_group(build.case),
-        "plate": _serialize_part_with_group(build.plate),
-        "stabilizer": _serialize_part(build.stabilizer),
-        "switch": _serialize_part(build.switch),
-        "keycap": _serialize_part(build.keycap),
+        "id": post.id,
+        "title": post.title,
+        "category": post.category,
+        "like_count": post.like_count,
+        "is_liked": is_liked,
+        "comment_count": post.comment_count,
+        "author": author,
+        "build": build,
+        "created_at": post.created_at,
     }
 
 
-def _get_build_data(post: Post) -> Optional[dict]:
-    if post.build_id and post.build:
-        return _serialize_build(post.build)
-    return None
+def _author_dict(user) -> dict:
+    return {"id": user.id, "nickname": user.nickname, "profile_image": user.profile_image}
 
 
-def _build_post_list_item(post, comment_count: int = 0, is_liked: bool = False) -> PostListItem:
-    return PostListItem(
-        id=post.id,
-        title=post.title,
-        category=post.category,
-        like_count=post.like_count,
-        is_liked=is_liked,
-        comment_count=comment_count,
-        author=PostAuthor(
-            id=post.user.id,
-            nickname=post.user.nickname,
-            profile_image=post.user.profile_image,
-        ),
-        build=_get_build_data(post),
-        created_at=post.created_at,
-    )
+def _authors_select(user_ids):
+    return sa.select(User.id, User.nickname, User.profile_image).where(User.id.in_(user_ids))
 
 
-def _build_comment_response(comment: Comment, depth: int = 0) -> CommentResponse:
-    replies = []
-    if depth < 1:
-        replies = [_build_comment_response(r, depth + 1) for r in comment.replies]
-    return CommentResponse(
-        id=comment.id,
-        content=comment.content,
-        author=CommentAuthor(
-            id=comment.user.id,
-            nickname=comment.user.nickname,
-            profile_image=comment.user.profile_image,
-        ),
-        parent_comment_id=comment.parent_comment_id,
-        replies=replies,
-        created_at=comment.created_at,
-    )
+def _assemble_post_list_items(rows: List[Post], author_rows, builds: dict, liked_ids: set) -> List[dict]:
+    authors = {
+        user_id: {"id": user_id, "nickname": nickname, "profile_image": profile_image}
+        for user_id, nickname, profile_image in author_rows
+    }
+    return [
+        _build_post_list_item(post, post.id in liked_ids, authors[post.user_id], builds.get(post.build_id))
+        for post in rows
+    ]
 
 
-def _posts_list_query(db: Session, user_id: Optional[int] = None):
-    """Lightweight query for post lists - no comments loaded."""
-    comment_count_sq = (
-        db.query(
-            Comment.post_id,
-            sa_func.count(Comment.id).label("cnt"),
-        )
-        .group_by(Comment.post_id)
-        .subquery()
+def _load_post_list_items(db: Session, rows: List[Post], user_id: Optional[int]) -> List[dict]:
+    """
+    게시글 목록 2단계 로딩
+    - 1단계(_posts_list_query): 페이지의 게시글 row만 조회 (join 없음)
+    - 2단계: 작성자/빌드/부품/좋아요 여부를 id IN 으로 일괄 조회해 id 기준으로 조립
+      (같은 부품이 여러 게시글에 있어도 한 번만 조회/직렬화)
+    """
+    if not rows:
+        return []
+    author_rows = db.execute(_authors_select({post.user_id for post in rows})).all()
+    builds = load_build_payloads(db, {post.build_id for post in rows if post.build_id})
+    liked_ids = liked_post_ids(db, user_id, [post.id for post in rows])
+    return _assemble_post_list_items(rows, author_rows, builds, liked_ids)
+
+
+async def _load_post_list_items_async(db: AsyncSession, rows: List[Post], user_id: Optional[int]) -> List[dict]:
+    """_load_post_list_items의 async 버전 - 빌드 payload(부품 캐시 + 직렬화)만 threadpool의 sync 세션에서"""
+    if not rows:
+        return []
+    author_rows = (await db.execute(_authors_select({post.user_id for post in rows}))).all()
+    liked_ids = await resolve_liked_ids_async(db, PostLike.post_id, user_id, [post.id for post in rows])
+    build_ids = {post.build_id for post in rows if post.build_id}
+    builds = await run_in_threadpool(run_in_session, load_build_payloads, build_ids) if build_ids else {}
+    return _assemble_post_list_items(rows, author_rows, builds, liked_ids)
+
+
+def _build_comment_response(
+    comment: Comment,
+    replies: List[dict] = (),
+    reply_count: int = 0,
+    replies_cursor: Optional[str] = None,
+) -> dict:
+    return {
+        "id": comment.id,
+        "content": comment.content,
+        "author": _author_dict(comment.user),
+        "parent_comment_id": comment.parent_comment_id,
+        "replies": list(replies),
+        "reply_count": reply_count,
+        "replies_cursor": replies_cursor,
+        "created_at": comment.created_at,
+    }
+
+
+def _comments_query(db: Session):
+    return db.query(Comment).options(joinedload(Comment.user))
+
+
+def _load_comment_threads(db: Session, comments: List[Comment]) -> List[dict]:
+    """
+    최상위 댓글 목록 -> 답글 수 + 답글 미리보기(REPLY_PREVIEW_SIZE개) 포함 응답
+    - 답글 수: 페이지 댓글 id로 GROUP BY 1회
+    - 미리보기: 댓글별 row_number()로 앞부분만 조회 1회 (답글 전체를 불러오지 않음)
+    """
+    if not comments:
+        return []
+    ids = [c.id for c in comments]
+    reply_counts = dict(
+        db.query(Comment.parent_comment_id, sa_func.count(Comment.id))
+        .filter(Comment.parent_comment_id.in_(ids))
+        .group_by(Comment.parent_comment_id)
+        .all()
     )
 
-    liked_sq = sa.literal(False).label("is_liked")
-    if user_id is not None:
-        liked_sq = (
-            sa.exists(
-                sa.select(PostLike.id)
-                .where(PostLike.post_id == Post.id, PostLike.user_id == user_id)
-            )
-        ).label("is_liked")
-
-    return (
-        db.query(Post, sa_func.coalesce(comment_count_sq.c.cnt, 0).label("comment_count"), liked_sq)
-        .outerjoin(comment_count_sq, Post.id == comment_count_sq.c.post_id)
-        .options(
-            joinedload(Post.user),
-            joinedload(Post.build).joinedload(Build.pcb).joinedload(PCB.compatible_group),
-            joinedload(Post.build).joinedload(Build.case).joinedload(Case.compatible_group),
-            joinedload(Post.build).joinedload(Build.plate).joinedload(Plate.compatible_group),
-            joinedload(Post.build).joinedload(Build.stabilizer),
-            joinedload(Post.build).joinedload(Build.switch),
-            joinedload(Post.build).joinedload(Build.keycap),
+    previews = {comment_id: [] for comment_id in ids}
+    if reply_counts:
+        rn = sa_func.row_number().over(
+            partition_by=Comment.parent_comment_id,
+            order_by=(Comment.created_at, Comment.id),
+        ).label("rn")
+        ranked = (
+            db.query(Comment.id, rn)
+            .filter(Comment.parent_comment_id.in_(list(reply_counts)))
+            .subquery()
         )
-    )
+        replies = (
+            _comments_query(db)
+            .join(ranked, Comment.id == ranked.c.id)
+            .filter(ranked.c.rn <= REPLY_PREVIEW_SIZE)
+            .order_by(Comment.created_at, Comment.id)
+            .all()
+        )
+        for reply in replies:
+            previews[reply.parent_comment_id].append(reply)
+
+    result = []
+    for comment in comments:
+        replies = previews[comment.id]
+        reply_count = reply_counts.get(comment.id, 0)
+        replies_cursor = cursor_for(replies[-1], COMMENT_KEY) if reply_count > len(replies) else None
+        result.append(_build_comment_response(
+            comment, [_build_comment_response(r) for r in replies], reply_count, replies_cursor,
+        ))
+    return result
+
+
+def _load_comment_page(db: Session, post_id: int, cursor: Optional[str], limit: int):
+    """게시글의 최상위 댓글 한 페이지 (오래된 순) -> (응답 목록, 다음 cursor)"""
+    query = _comments_query(db).filter(Comment.post_id == post_id, Comment.parent_comment_id.is_(None))
+    query = keyset_paginate(query, COMMENT_KEY, cursor, limit, descending=False)
+    comments, next_cursor = split_page(query.all(), limit, COMMENT_KEY)
+    return _load_comment_threads(db, comments), next_cursor
+
+
+def _posts_list_query(db: Session):
+    """Lightweight query for post lists - post rows only, related rows via _load_post_list_items."""
+    return db.query(Post)
+
+
+def _paginate_posts(query, key, cursor: Optional[str], limit: int, response: Response):
+    """게시글 목록 keyset 페이지네이션 (offset 미지원 - 다음 페이지는 X-Next-Cursor로)"""
+    query = keyset_paginate(query, key, cursor, limit)
+    rows, next_cursor = split_page(query.all(), limit, key)
+    set_next_cursor(response, next_cursor)
+    return rows
 
 
 def _posts_detail_query(db: Session):
-    """Full query for single post detail - includes comments with users."""
-    return (
-        db.query(Post)
-        .options(
-            joinedload(Post.user),
-            joinedload(Post.comments).joinedload(Comment.user),
-            joinedload(Post.comments).joinedload(Comment.replies).joinedload(Comment.user),
-            joinedload(Post.build).joinedload(Build.pcb).joinedload(PCB.compatible_group),
-            joinedload(Post.build).joinedload(Build.case).joinedload(Case.compatible_group),
-            joinedload(Post.build).joinedload(Build.plate).joinedload(Plate.compatible_group),
-            joinedload(Post.build).joinedload(Build.stabilizer),
-            joinedload(Post.build).joinedload(Build.switch),
-            joinedload(Post.build).joinedload(Build.keycap),
-        )
-    )
+    """Single post detail - author only, build and comments loaded separately."""
+    return db.query(Post).options(joinedload(Post.user))
 
 
 # --- Posts ---
 
 @router.get("/me/posts", response_model=List[PostListItem])
 def get_my_posts(
-    limit: int = 20,
-    offset: int = 0,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
 ):
-    query = _posts_list_query(db, current_user.id)
-    query = query.filter(Post.user_id == current_user.id)
-    query = query.order_by(Post.created_at.desc())
-    rows = query.offset(offset).limit(limit).all()
-    return [_build_post_list_item(post, comment_count, is_liked) for post, comment_count, is_liked in rows]
+    query = _posts_list_query(db)
+    query = query.filter(Post.user_id == current_user_id)
+    rows = _paginate_posts(query, RECENT_POST_KEY, cursor, limit, response)
+    return post_list_serializer.response(_load_post_list_items(db, rows, current_user_id), response)
 
 
 @router.get("/me/comments", response_model=List[MyCommentResponse])
 def get_my_comments(
-    limit: int = 20,
-    offset: int = 0,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
 ):
-    reply_count_sq = (
-        db.query(
-            Comment.parent_comment_id,
-            sa_func.count(Comment.id).label("cnt"),
-        )
-        .filter(Comment.parent_comment_id.isnot(None))
-        .group_by(Comment.parent_comment_id)
-        .subquery()
+    # 답글 수는 페이지의 댓글마다 correlated subquery로 (parent_comment_id 인덱스 범위만 count)
+    # - 테이블 전체 GROUP BY를 join하면 페이지 비용이 comments 크기에 비례
+    reply = aliased(Comment)
+    reply_count = (
+        sa.select(sa_func.count(reply.id))
+        .where(reply.parent_comment_id == Comment.id)
+        .correlate(Comment)
+        .scalar_subquery()
     )
 
-    rows = (
+    query = (
         db.query(
             Comment,
             Post.title.label("post_title"),
-            sa_func.coalesce(reply_count_sq.c.cnt, 0).label("reply_count"),
+            reply_count.label("reply_count"),
         )
         .join(Post, Comment.post_id == Post.id)
-        .outerjoin(reply_count_sq, Comment.id == reply_count_sq.c.parent_comment_id)
-        .filter(Comment.user_id == current_user.id)
-        .order_by(Comment.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+        .filter(Comment.user_id == current_user_id)
     )
-
-    return [
-        MyCommentResponse(
-            id=comment.id,
-            content=comment.content,
-            post_id=comment.post_id,
-            post_title=post_title,
-            parent_comment_id=comment.parent_comment_id,
-            reply_count=reply_count,
-            created_at=comment.created_at,
-        )
+    query = keyset_paginate(query, COMMENT_KEY, cursor, limit)
+    rows, next_cursor = split_page(query.all(), limit, COMMENT_KEY, entity=lambda row: row[0])
+    set_next_cursor(response, next_cursor)
+
+    return my_comment_list_serializer.response([
+        {
+            "id": comment.id,
+            "content": comment.content,
+            "post_id": comment.post_id,
+            "post_title": post_title,
+            "parent_comment_id": comment.parent_comment_id,
+            "reply_count": reply_count,
+            "created_at": comment.created_at,
+        }
         for comment, post_title, reply_count in rows
-    ]
+    ], response)
 
 
 @router.get("/posts", response_model=List[PostListItem])
 def get_posts(
+    response: Response,
     category: Optional[PostCategory] = None,
     sort: str = Query("recent", pattern="^(recent|popular)$"),
-    limit: int = 20,
-    offset: int = 0,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user_id: Optional[int] = Depends(get_optional_user_id),
 ):
-    user_id = current_user.id if current_user else None
-    query = _posts_list_query(db, user_id)
+    query = _posts_list_query(db)
     if category:
         query = query.filter(Post.category == category)
 
-    if sort == "popular":
-        query = query.order_by(Post.like_count.desc(), Post.created_at.desc())
-    else:
-        query = query.order_by(Post.created_at.desc())
+    key = POPULAR_POST_KEY if sort == "popular" else RECENT_POST_KEY
+    rows = _paginate_posts(query, key, cursor, limit, response)
+    return post_list_serializer.response(_load_post_list_items(db, rows, current_user_id), response)
 
-    rows = query.offset(offset).limit(limit).all()
-    return [_build_post_list_item(post, comment_count, is_liked) for post, comment_count, is_liked in rows]
+
+# async 모드: 조회는 AsyncSession으로 await, JSON 직렬화는 threadpool
+@async_router.get("/posts", response_model=List[PostListItem])
+async def get_posts_async(
+    response: Response,
+    category: Optional[PostCategory] = None,
+    sort: str = Query("recent", pattern="^(recent|popular)$"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user_id: Optional[int] = Depends(get_optional_user_id),
+):
+    stmt = sa.select(Post)
+    if category:
+        stmt = stmt.where(Post.category == category)
+
+    key = POPULAR_POST_KEY if sort == "popular" else RECENT_POST_KEY
+    stmt = keyset_paginate(stmt, key, cursor, limit)
+    rows, next_cursor = split_page((await db.scalars(stmt)).all(), limit, key)
+    set_next_cursor(response, next_cursor)
+    items = await _load_post_list_items_async(db, rows, current_user_id)
+    return await run_in_threadpool(post_list_serializer.response, items, response)
+
+
+@router.get("/search", response_model=List[PostListItem])
+def search_posts(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=100),
+    category: Optional[PostCategory] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user_id: Optional[int] = Depends(get_optional_user_id),
+):
+    """제목/본문 전문 검색 (GIN index), 관련도순 + cursor 페이지네이션"""
+    terms = prefix_tsquery(q)
+    if terms is None:
+        return []
+
+    query_expr = to_tsquery(terms)
+    rank = search_rank(Post.search_vector, query_expr)
+    query = db.query(Post, rank.label("rank")).filter(Post.search_vector.bool_op("@@")(query_expr))
+    if category:
+        query = query.filter(Post.category == category)
+
+    key = ((rank, float), (Post.id, int))
+    query = keyset_paginate(query, key, cursor, limit)
+    rows, next_cursor = split_page(query.all(), limit, key, values=lambda row: [row.rank, row.Post.id])
+    set_next_cursor(response, next_cursor)
+    return post_list_serializer.response(_load_post_list_items(db, [row.Post for row in rows], current_user_id), response)
 
 
 @router.get("/posts/{post_id}", response_model=PostResponse)
 def get_post(
     post_id: int,
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    current_user_id: Optional[int] = Depends(get_optional_user_id),
 ):
     post = _posts_detail_query(db).filter(Post.id == post_id).first()
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    is_liked = False
-    if current_user:
-        existing = (
-            db.query(PostLike)
-            .filter(PostLike.user_id == current_user.id, PostLike.post_id == post_id)
-            .first()
-        )
-        is_liked = existing is not None
+    is_liked = post_id in liked_post_ids(db, current_user_id, [post_id])
 
-    top_level_comments = [c for c in post.comments if c.parent_comment_id is None]
-    comments = [_build_comment_response(c) for c in top_level_comments]
+    comments, comments_cursor = _load_comment_page(db, post_id, None, COMMENT_PAGE_SIZE)
 
-    return PostResponse(
-        id=post.id,
-        title=post.title,
-        content=post.content,
-        category=post.category,
-        like_count=post.like_count,
-        is_liked=is_liked,
-        comment_count=len(post.comments),
-        author=PostAuthor(
-            id=post.user.id,
-            nickname=post.user.nickname,
-            profile_image=post.user.profile_image,
-        ),
-        build=_get_build_data(post),
-        comments=comments,
-        created_at=post.created_at,
-        updated_at=post.updated_at,
-    )
+    return post_serializer.response({
+        "id": post.id,
+        "title": post.title,
+        "content": post.content,
+        "category": post.category,
+        "like_count": post.like_count,
+        "is_liked": is_liked,
+        "comment_count": post.comment_count,
+        "author": _author_dict(post.user),
+        "build": _get_build_data(db, post),
+        "comments": comments,
+        "comments_cursor": comments_cursor,
+        "created_at": post.created_at,
+        "updated_at": post.updated_at,
+    })
 
 
 @router.post("/posts", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
@@ -285,14 +374,14 @@ def create_post(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    build_data = None
-
+    published = False  # 비공개 빌드가 쇼케이스로 공개됨 -> 공개 빌드 피드 무효화
     if data.build_id and data.category == PostCategory.showcase:
         build = db.query(Build).filter(Build.id == data.build_id).first()
         if not build:
             raise HTTPException(status_code=404, detail="Build not found")
         if build.user_id != current_user.id:
             raise HTTPException(status_code=403, detail="Not your build")
+        published = not build.is_public
         build.is_public = True
 
     post = Post(
@@ -304,12 +393,10 @@ def create_post(
     )
     db.add(post)
     db.commit()
+    if published:
+        build_feed_cache.invalidate()
     db.refresh(post)
 
-    if post.build_id:
-        post = _posts_detail_query(db).filter(Post.id == post.id).first()
-        build_data = _get_build_data(post)
-
     return PostResponse(
         id=post.id,
         title=post.title,
@@ -323,7 +410,7 @@ def create_post(
             nickname=current_user.nickname,
             profile_image=current_user.profile_image,
         ),
-        build=build_data,
+        build=_get_build_data(db, post),
         comments=[],
         created_at=post.created_at,
         updated_at=post.updated_at,
@@ -350,8 +437,7 @@ def update_post(
     db.commit()
     db.refresh(post)
 
-    top_level_comments = [c for c in post.comments if c.parent_comment_id is None]
-    comments = [_build_comment_response(c) for c in top_level_comments]
+    comments, comments_cursor = _load_comment_page(db, post_id, None, COMMENT_PAGE_SIZE)
 
     return PostResponse(
         id=post.id,
@@ -359,15 +445,16 @@ def update_post(
         content=post.content,
         category=post.category,
         like_count=post.like_count,
-        is_liked=False,
-        comment_count=len(post.comments),
+        is_liked=post_id in liked_post_ids(db, current_user.id, [post_id]),
+        comment_count=post.comment_count,
         author=PostAuthor(
             id=current_user.id,
             nickname=current_user.nickname,
             profile_image=current_user.profile_image,
         ),
-        build=_get_build_data(post),
+        build=_get_build_data(db, post),
         comments=comments,
+        comments_cursor=comments_cursor,
         created_at=post.created_at,
         updated_at=post.updated_at,
     )
@@ -395,61 +482,56 @@ def toggle_post_like(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
+    result = toggle_like(db, PostLike.post_id, current_user.id, post_id)
+    if result is None:
         raise HTTPException(status_code=404, detail="Post not found")
+    db.commit()
 
-    existing = (
-        db.query(PostLike)
-        .filter(PostLike.user_id == current_user.id, PostLike.post_id == post_id)
-        .first()
+    # like_count는 write-behind 버퍼에 모았다가 주기적으로 반영 (app.services.likes)
+    if result.delta:
+        post_like_counter.add(post_id, result.delta, decay_weight(result.created_at))
+    return PostLikeResponse(
+        liked=result.liked,
+        like_count=max(0, result.like_count + post_like_counter.pending(post_id)),
     )
 
-    if existing:
-        db.delete(existing)
-        db.execute(
-            sa.update(Post)
-            .where(Post.id == post_id)
-            .values(like_count=sa.func.greatest(0, Post.like_count - 1))
-        )
-        liked = False
-    else:
-        like = PostLike(user_id=current_user.id, post_id=post_id)
-        db.add(like)
-        db.execute(
-            sa.update(Post)
-            .where(Post.id == post_id)
-            .values(like_count=Post.like_count + 1)
-        )
-        liked = True
-
-    db.commit()
-    db.refresh(post)
-    return PostLikeResponse(liked=liked, like_count=post.like_count)
-
 
 # --- Comments ---
 
 @router.get("/posts/{post_id}/comments", response_model=List[CommentResponse])
 def get_comments(
     post_id: int,
+    response: Response,
+    limit: int = Query(COMMENT_PAGE_SIZE, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = db.query(Post.id).filter(Post.id == post_id).first()
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    comments = (
-        db.query(Comment)
-        .options(
-            joinedload(Comment.user),
-            joinedload(Comment.replies).joinedload(Comment.user),
-        )
-        .filter(Comment.post_id == post_id, Comment.parent_comment_id.is_(None))
-        .order_by(Comment.created_at.asc())
-        .all()
-    )
-    return [_build_comment_response(c) for c in comments]
+    comments, next_cursor = _load_comment_page(db, post_id, cursor, limit)
+    set_next_cursor(response, next_cursor)
+    return comment_list_serializer.response(comments, response)
+
+
+@router.get("/comments/{comment_id}/replies", response_model=List[CommentResponse])
+def get_replies(
+    comment_id: int,
+    response: Response,
+    limit: int = Query(COMMENT_PAGE_SIZE, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    comment = db.query(Comment.id).filter(Comment.id == comment_id).first()
+    if not comment:
+        raise HTTPException(status_code=404, detail="Comment not found")
+
+    query = _comments_query(db).filter(Comment.parent_comment_id == comment_id)
+    query = keyset_paginate(query, COMMENT_KEY, cursor, limit, descending=False)
+    replies, next_cursor = split_page(query.all(), limit, COMMENT_KEY)
+    set_next_cursor(response, next_cursor)
+    return comment_list_serializer.response([_build_comment_response(r) for r in replies], response)
 
 
 @router.post("/posts/{post_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
@@ -479,6 +561,11 @@ def create_comment(
         content=data.content,
     )
     db.add(comment)
+    db.execute(
+        sa.update(Post)
+        .where(Post.id == post_id)
+        .values(comment_count=Post.comment_count + 1, updated_at=Post.updated_at)
+    )
     db.commit()
     db.refresh(comment)
 
@@ -508,6 +595,20 @@ def delete_comment(
     if comment.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
 
+    # 답글은 한 번에 삭제 (cascade로 답글 전체를 불러오지 않도록), 삭제된 수만큼 comment_count 감소
+    removed = 1 + (
+        db.query(Comment)
+        .filter(Comment.parent_comment_id == comment_id)
+        .delete(synchronize_session=False)
+    )
+    db.execute(
+        sa.update(Post)
+        .where(Post.id == comment.post_id)
+        .values(
+            comment_count=sa.func.greatest(0, Post.comment_count - removed),
+            updated_at=Post.updated_at,  # 댓글 수 변경은 게시글 수정이 아님
+        )
+    )
     db.delete(comment)
     db.commit()
 
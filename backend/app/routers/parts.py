@@ -1,91 +1,140 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session, joinedload
-from typing import List
-from app.database import get_db
+from typing import List, Literal, Optional
+from app.database import get_db, run_in_session
 from app.models import PCB, Case, Plate, Stabilizer, Switch, Keycap, CompatibleGroup
 from app.schemas import (
     PCBResponse, CaseResponse, PlateResponse,
     StabilizerResponse, SwitchResponse, KeycapResponse,
-    CompatibleGroupResponse, AllPartsResponse
+    CompatibleGroupResponse, AllPartsResponse, PartSearchResponse
 )
+from app.schemas.compatibility import (
+    BatchCompatibilityRequest, BatchCompatibilityResponse, CompatibleOptionsResponse,
+    BuildSuggestion,
+)
+from app.models.parts import LayoutType, MountingType, SwitchType, KeycapProfile
 from app.services.compatibility import CompatibilityService
+from app.services.catalog import PART_TABLES, cached_catalog_snapshot, get_catalog_snapshot
+from app.services.serializers import serialize_part
+from app.services.part_search import CATEGORY_NAMES, facet_value, get_part_search_index
+from app.pagination import encode_cursor, decode_cursor
+from app.etag import etag_guard
 
 router = APIRouter(prefix="/api/parts", tags=["parts"])
-
-def _serialize_with_group(obj):
-    """compatible_group_name을 포함하는 dict 변환"""
-    data = {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
-    if hasattr(obj, 'compatible_group') and obj.compatible_group:
-        data['compatible_group_name'] = obj.compatible_group.name
-    else:
-        data['compatible_group_name'] = None
-    return data
-
-@router.get("/all", response_model=AllPartsResponse)
-def get_all_parts(db: Session = Depends(get_db)):
-    pcbs = db.query(PCB).options(joinedload(PCB.compatible_group)).all()
-    cases = db.query(Case).options(joinedload(Case.compatible_group)).all()
-    plates = db.query(Plate).options(joinedload(Plate.compatible_group)).all()
-    return {
-        "pcbs": [_serialize_with_group(p) for p in pcbs],
-        "cases": [_serialize_with_group(c) for c in cases],
-        "plates": [_serialize_with_group(p) for p in plates],
-        "stabilizers": db.query(Stabilizer).all(),
-        "switches": db.query(Switch).all(),
-        "keycaps": db.query(Keycap).all(),
-        "compatible_groups": db.query(CompatibleGroup).all(),
-    }
+# async 모드에서 router보다 먼저 등록되는 async 핸들러 (같은 경로를 대체)
+async_router = APIRouter(prefix="/api/parts", tags=["parts"])
+
+# 카탈로그 조회는 부품 테이블 버전 기반 ETag로 조건부 응답
+catalog_etag = [Depends(etag_guard(*PART_TABLES))]
+
+# 미리 직렬화 + gzip 된 카탈로그 스냅샷을 그대로 응답 (부품 테이블 변경 시에만 재생성)
+@router.get("/all", response_model=AllPartsResponse, dependencies=catalog_etag)
+def get_all_parts(request: Request, db: Session = Depends(get_db)):
+    snapshot = get_catalog_snapshot(db)
+    return snapshot.to_response(request.headers.get("accept-encoding", ""), request.state.etag_headers)
+
+# async 모드: 최신 스냅샷이면 event loop에서 바로 응답, 재생성(조회 + 직렬화 + gzip)만 threadpool
+@async_router.get("/all", response_model=AllPartsResponse, dependencies=catalog_etag)
+async def get_all_parts_async(request: Request):
+    snapshot = cached_catalog_snapshot()
+    if snapshot is None:
+        snapshot = await run_in_threadpool(run_in_session, get_catalog_snapshot)
+    return snapshot.to_response(request.headers.get("accept-encoding", ""), request.state.etag_headers)
 
 # Compatible Groups
-@router.get("/compatible-groups", response_model=List[CompatibleGroupResponse])
+@router.get("/compatible-groups", response_model=List[CompatibleGroupResponse], dependencies=catalog_etag)
 def get_compatible_groups(db: Session = Depends(get_db)):
     return db.query(CompatibleGroup).all()
 
 # PCB
-@router.get("/pcbs", response_model=List[PCBResponse])
+# 카탈로그 facet 검색 (메모리 인덱스의 bitset으로 필터/facet count 계산, DB는 인덱스 재생성 시에만 조회)
+# - 같은 필터를 여러 값으로 주면 OR (?layout=60%&layout=65%), 필터끼리는 AND
+@router.get("/search", response_model=PartSearchResponse, dependencies=catalog_etag)
+def search_parts(
+    category: List[Literal[CATEGORY_NAMES]] = Query(None),
+    layout: List[LayoutType] = Query(None),
+    mounting_type: List[MountingType] = Query(None),
+    switch_type: List[SwitchType] = Query(None),
+    hotswap: Optional[bool] = None,
+    rgb: Optional[bool] = None,
+    material: List[str] = Query(None),
+    profile: List[KeycapProfile] = Query(None),
+    min_price: Optional[float] = Query(None, ge=0),
+    max_price: Optional[float] = Query(None, ge=0),
+    min_actuation_force: Optional[float] = Query(None, ge=0),
+    max_actuation_force: Optional[float] = Query(None, ge=0),
+    sort: Literal["price_asc", "price_desc"] = "price_asc",
+    limit: int = Query(24, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    filters = {
+        "category": category,
+        "layout": layout,
+        "mounting_type": mounting_type,
+        "switch_type": switch_type,
+        "hotswap": None if hotswap is None else [hotswap],
+        "rgb": None if rgb is None else [rgb],
+        "material": material,
+        "profile": profile,
+    }
+    filters = {facet: [facet_value(v) for v in values] for facet, values in filters.items() if values}
+    ranges = {
+        "price": (min_price, max_price),
+        "actuation_force": (min_actuation_force, max_actuation_force),
+    }
+    after = tuple(decode_cursor(cursor, float, int, int)) if cursor else None
+
+    result = get_part_search_index(db).search(filters, ranges, sort=sort, after=after, limit=limit)
+    next_key = result.pop("next_key")
+    result["next_cursor"] = encode_cursor(next_key) if next_key else None
+    return result
+
+@router.get("/pcbs", response_model=List[PCBResponse], dependencies=catalog_etag)
 def get_pcbs(db: Session = Depends(get_db)):
     pcbs = db.query(PCB).options(joinedload(PCB.compatible_group)).all()
-    return [_serialize_with_group(p) for p in pcbs]
+    return [serialize_part(p) for p in pcbs]
 
-@router.get("/pcbs/{pcb_id}", response_model=PCBResponse)
+@router.get("/pcbs/{pcb_id}", response_model=PCBResponse, dependencies=catalog_etag)
 def get_pcb(pcb_id: int, db: Session = Depends(get_db)):
     pcb = db.query(PCB).options(joinedload(PCB.compatible_group)).filter(PCB.id == pcb_id).first()
     if not pcb:
         raise HTTPException(status_code=404, detail="PCB not found")
-    return _serialize_with_group(pcb)
+    return serialize_part(pcb)
 
 # Case
-@router.get("/cases", response_model=List[CaseResponse])
+@router.get("/cases", response_model=List[CaseResponse], dependencies=catalog_etag)
 def get_cases(db: Session = Depends(get_db)):
     cases = db.query(Case).options(joinedload(Case.compatible_group)).all()
-    return [_serialize_with_group(c) for c in cases]
+    return [serialize_part(c) for c in cases]
 
-@router.get("/cases/{case_id}", response_model=CaseResponse)
+@router.get("/cases/{case_id}", response_model=CaseResponse, dependencies=catalog_etag)
 def get_case(case_id: int, db: Session = Depends(get_db)):
     case = db.query(Case).options(joinedload(Case.compatible_group)).filter(Case.id == case_id).first()
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
-    return _serialize_with_group(case)
+    return serialize_part(case)
 
 # Plate
-@router.get("/plates", response_model=List[PlateResponse])
+@router.get("/plates", response_model=List[PlateResponse], dependencies=catalog_etag)
 def get_plates(db: Session = Depends(get_db)):
     plates = db.query(Plate).options(joinedload(Plate.compatible_group)).all()
-    return [_serialize_with_group(p) for p in plates]
+    return [serialize_part(p) for p in plates]
 
-@router.get("/plates/{plate_id}", response_model=PlateResponse)
+@router.get("/plates/{plate_id}", response_model=PlateResponse, dependencies=catalog_etag)
 def get_plate(plate_id: int, db: Session = Depends(get_db)):
     plate = db.query(Plate).options(joinedload(Plate.compatible_group)).filter(Plate.id == plate_id).first()
     if not plate:
         raise HTTPException(status_code=404, detail="Plate not found")
-    return _serialize_with_group(plate)
+    return serialize_part(plate)
 
 # Stabilizer
-@router.get("/stabilizers", response_model=List[StabilizerResponse])
+@router.get("/stabilizers", response_model=List[StabilizerResponse], dependencies=catalog_etag)
 def get_stabilizers(db: Session = Depends(get_db)):
     return db.query(Stabilizer).all()
 
-@router.get("/stabilizers/{stab_id}", response_model=StabilizerResponse)
+@router.get("/stabilizers/{stab_id}", response_model=StabilizerResponse, dependencies=catalog_etag)
 def get_stabilizer(stab_id: int, db: Session = Depends(get_db)):
     stab = db.query(Stabilizer).filter(Stabilizer.id == stab_id).first()
     if not stab:
@@ -93,11 +142,11 @@ def get_stabilizer(stab_id: int, db: Session = Depends(get_db)):
     return stab
 
 # Switch
-@router.get("/switches", response_model=List[SwitchResponse])
+@router.get("/switches", response_model=List[SwitchResponse], dependencies=catalog_etag)
 def get_switches(db: Session = Depends(get_db)):
     return db.query(Switch).all()
 
-@router.get("/switches/{switch_id}", response_model=SwitchResponse)
+@router.get("/switches/{switch_id}", response_model=SwitchResponse, dependencies=catalog_etag)
 def get_switch(switch_id: int, db: Session = Depends(get_db)):
     switch = db.query(Switch).filter(Switch.id == switch_id).first()
     if not switch:
@@ -105,11 +154,11 @@ def get_switch(switch_id: int, db: Session = Depends(get_db)):
     return switch
 
 # Keycap
-@router.get("/keycaps", response_model=List[KeycapResponse])
+@router.get("/keycaps", response_model=List[KeycapResponse], dependencies=catalog_etag)
 def get_keycaps(db: Session = Depends(get_db)):
     return db.query(Keycap).all()
 
-@router.get("/keycaps/{keycap_id}", response_model=KeycapResponse)
+@router.get("/keycaps/{keycap_id}", response_model=KeycapResponse, dependencies=catalog_etag)
 def get_keycap(keycap_id: int, db: Session = Depends(get_db)):
     keycap = db.query(Keycap).filter(Keycap.id == keycap_id).first()
     if not keycap:
@@ -133,3 +182,74 @@ def check_compatibility(
         switch_id=switch_id,
         keycap_id=keycap_id
     )
+
+# 여러 조합을 한 번에 검사 (저장된 빌드 일괄 점검 등), 결과는 요청 순서대로
+@router.post("/compatibility/check/batch", response_model=BatchCompatibilityResponse)
+def check_compatibility_batch(
+    data: BatchCompatibilityRequest,
+    db: Session = Depends(get_db)
+):
+    service = CompatibilityService(db)
+    items = [item.model_dump() for item in data.items]
+    return {"results": service.check_compatibility_batch(items)}
+
+
+# 현재 선택 기준으로 남은 카테고리에서 고를 수 있는 부품 id (클라이언트 전체 카탈로그 필터링 대체)
+@router.get(
+    "/compatibility/options",
+    response_model=CompatibleOptionsResponse,
+    response_model_exclude_none=True,
+    dependencies=catalog_etag,
+)
+def get_compatible_options(
+    pcb_id: int = None,
+    case_id: int = None,
+    plate_id: int = None,
+    stabilizer_id: int = None,
+    switch_id: int = None,
+    keycap_id: int = None,
+    db: Session = Depends(get_db)
+):
+    service = CompatibilityService(db)
+    return service.compatible_options(
+        pcb_id=pcb_id,
+        case_id=case_id,
+        plate_id=plate_id,
+        stabilizer_id=stabilizer_id,
+        switch_id=switch_id,
+        keycap_id=keycap_id
+    )
+
+
+# 고정 부품 + 예산 기준 가장 싼 완전 호환 빌드 (스위치는 PCB 레이아웃별 수량 반영)
+@router.get(
+    "/compatibility/cheapest-builds",
+    response_model=List[BuildSuggestion],
+    dependencies=catalog_etag,
+)
+def get_cheapest_builds(
+    pcb_id: int = None,
+    case_id: int = None,
+    plate_id: int = None,
+    stabilizer_id: int = None,
+    switch_id: int = None,
+    keycap_id: int = None,
+    layout: LayoutType = None,
+    max_price: float = Query(None, gt=0),
+    limit: int = Query(5, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    service = CompatibilityService(db)
+    return service.cheapest_builds(
+        fixed={
+            "pcb": pcb_id,
+            "case": case_id,
+            "plate": plate_id,
+            "stabilizer": stabilizer_id,
+            "switch": switch_id,
+            "keycap": keycap_id,
+        },
+        max_price=max_price,
+        limit=limit,
+        layout=layout,
+    )
@@ -6,7 +6,8 @@ from app.schemas.parts import (
     SwitchBase, SwitchCreate, SwitchResponse,
     KeycapBase, KeycapCreate, KeycapResponse,
     CompatibleGroupResponse,
-    AllPartsResponse
+    AllPartsResponse,
+    PartSearchItem, PartSearchResponse
 )
 from app.schemas.auth import UserCreate, UserLogin, UserResponse, TokenResponse
 from app.schemas.build import BuildCreate, BuildUpdate, BuildListItem, BuildResponse
@@ -58,7 +58,9 @@ class CommentResponse(BaseModel):
     content: str
     author: CommentAuthor
     parent_comment_id: Optional[int] = None
-    replies: list[CommentResponse] = []
+    replies: list[CommentResponse] = []  # 답글 미리보기 (앞부분 일부)
+    reply_count: int = 0
+    replies_cursor: Optional[str] = None  # 미리보기 이후 답글 조회용 cursor (더 없으면 None)
     created_at: datetime
 
     class Config:
@@ -80,7 +82,8 @@ class PostResponse(BaseModel):
     comment_count: int = 0
     author: PostAuthor
     build: Optional[BuildResponse] = None
-    comments: list[CommentResponse] = []
+    comments: list[CommentResponse] = []  # 첫 페이지 댓글
+    comments_cursor: Optional[str] = None  # 다음 댓글 페이지 cursor (더 없으면 None)
     created_at: datetime
     updated_at: datetime
 
@@ -0,0 +1,51 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+
+MAX_BATCH_SIZE = 20000
+
+
+class CompatibilityIssue(BaseModel):
+    type: str
+    parts: List[str]
+    message: str
+
+
+class CompatibilityResult(BaseModel):
+    compatible: bool
+    issues: List[CompatibilityIssue] = []
+
+
+class CompatibilityCheckItem(BaseModel):
+    pcb_id: Optional[int] = None
+    case_id: Optional[int] = None
+    plate_id: Optional[int] = None
+    switch_id: Optional[int] = None
+    keycap_id: Optional[int] = None
+
+
+class BatchCompatibilityRequest(BaseModel):
+    items: List[CompatibilityCheckItem] = Field(..., max_length=MAX_BATCH_SIZE)
+
+
+class BatchCompatibilityResponse(BaseModel):
+    results: List[CompatibilityResult]
+
+
+class CompatibleOptionsResponse(BaseModel):
+    """선택되지 않은 카테고리별 호환 가능한 부품 id (선택된 카테고리는 생략)"""
+    pcbs: Optional[List[int]] = None
+    cases: Optional[List[int]] = None
+    plates: Optional[List[int]] = None
+    stabilizers: Optional[List[int]] = None
+    switches: Optional[List[int]] = None
+    keycaps: Optional[List[int]] = None
+
+
+class BuildSuggestion(BaseModel):
+    total_price: float
+    pcb_id: int
+    case_id: int
+    plate_id: int
+    stabilizer_id: int
+    switch_id: int
+    keycap_id: int
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict
 from app.models.parts import (
     LayoutType, MountingType, SwitchType,
     StabilizerType, KeycapProfile
@@ -145,3 +145,14 @@ class AllPartsResponse(BaseModel):
     switches: List[SwitchResponse]
     keycaps: List[KeycapResponse]
     compatible_groups: List[CompatibleGroupResponse]
+
+# 부품 검색 (category: pcbs/cases/..., part: 해당 부품 Response와 같은 형태)
+class PartSearchItem(BaseModel):
+    category: str
+    part: dict
+
+class PartSearchResponse(BaseModel):
+    items: List[PartSearchItem]
+    facets: Dict[str, Dict[str, int]]
+    total: int
+    next_cursor: Optional[str] = None
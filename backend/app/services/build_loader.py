@@ -0,0 +1,105 @@
+from typing import Dict, Iterable, List
+
+from sqlalchemy.orm import Session, lazyload
+
+from app.models import PCB, Case, Plate, Stabilizer, Switch, Keycap, CompatibleGroup, Build
+from app.services.serializers import column_values, part_payload_cache
+from app.services.versions import load_versions
+
+# (slot, model, compatible_group_name 포함 여부) - Build 응답의 부품 필드 순서와 동일
+BUILD_PART_SLOTS = (
+    ("pcb", PCB, True),
+    ("case", Case, True),
+    ("plate", Plate, True),
+    ("stabilizer", Stabilizer, False),
+    ("switch", Switch, False),
+    ("keycap", Keycap, False),
+)
+
+
+def load_part_payloads(db: Session, ids_by_slot: Dict[str, Iterable[int]]) -> Dict[str, Dict[int, dict]]:
+    """
+    slot별 부품 id -> 직렬화된 dict
+    - part_payload_cache에 있는 부품은 조회하지 않고, 나머지만 slot마다 IN 조회 1회
+    - compatible group 이름은 한 번에 조회
+    - 같은 부품은 한 번만 직렬화하고 여러 빌드(요청)가 같은 dict를 공유
+    """
+    payloads, missing = {}, {}
+    for slot, model, _ in BUILD_PART_SLOTS:
+        ids = {i for i in ids_by_slot.get(slot, ()) if i is not None}
+        payloads[slot], slot_missing = part_payload_cache.split(model, ids)
+        if slot_missing:
+            missing[slot] = slot_missing
+    if not missing:
+        return payloads
+
+    # 캐시 저장용 버전은 부품보다 먼저 같은 세션에서 읽음
+    versions = load_versions(db, *{
+        table for slot, model, _ in BUILD_PART_SLOTS if slot in missing
+        for table in part_payload_cache.tables(model)
+    })
+
+    loaded, group_ids = {}, set()
+    for slot, model, with_group in BUILD_PART_SLOTS:
+        if slot not in missing:
+            continue
+        parts = db.query(model).options(lazyload("*")).filter(model.id.in_(missing[slot])).all()
+        loaded[slot] = parts
+        if with_group:
+            group_ids.update(p.compatible_group_id for p in parts if p.compatible_group_id)
+
+    group_names = {}
+    if group_ids:
+        group_names = dict(
+            db.query(CompatibleGroup.id, CompatibleGroup.name).filter(CompatibleGroup.id.in_(group_ids)).all()
+        )
+
+    for slot, model, with_group in BUILD_PART_SLOTS:
+        if slot not in loaded:
+            continue
+        fresh = {}
+        for part in loaded[slot]:
+            data = column_values(part)
+            if with_group:
+                data["compatible_group_name"] = group_names.get(part.compatible_group_id)
+            fresh[part.id] = data
+        payloads[slot].update(fresh)
+        part_payload_cache.store(model, sum(versions[t] for t in part_payload_cache.tables(model)), fresh)
+    return payloads
+
+
+def serialize_build_payload(build: Build, parts: Dict[str, Dict[int, dict]]) -> dict:
+    data = {
+        "id": build.id,
+        "name": build.name,
+        "user_id": build.user_id,
+        "is_public": build.is_public,
+        "like_count": build.like_count,
+        "created_at": build.created_at,
+        "updated_at": build.updated_at,
+    }
+    for slot, _, _ in BUILD_PART_SLOTS:
+        part_id = getattr(build, f"{slot}_id")
+        data[slot] = parts[slot].get(part_id) if part_id is not None else None
+    return data
+
+
+def load_build_payloads(db: Session, build_ids: Iterable[int]) -> Dict[int, dict]:
+    """
+    빌드 id 목록 -> 직렬화된 빌드 dict (부품 포함)
+    - 빌드는 부품 관계를 join 하지 않고 컬럼만 조회한 뒤 부품을 slot별로 일괄 조회
+    """
+    build_ids = set(build_ids)
+    if not build_ids:
+        return {}
+    builds = db.query(Build).filter(Build.id.in_(build_ids)).all()
+    return {payload["id"]: payload for payload in serialize_builds(db, builds)}
+
+
+def serialize_builds(db: Session, builds: List[Build]) -> List[dict]:
+    """이미 조회한 빌드 목록 -> 직렬화된 빌드 dict 목록 (부품은 id로 일괄 조회, 부품 관계는 사용하지 않음)"""
+    parts = load_part_payloads(
+        db, {slot: [getattr(b, f"{slot}_id") for b in builds] for slot, _, _ in BUILD_PART_SLOTS}
+    )
+    return [serialize_build_payload(b, parts) for b in builds]
+
@@ -0,0 +1,132 @@
+import heapq
+import itertools
+import math
+from typing import Dict, List, Optional, Tuple
+
+from app.models.parts import LayoutType
+from app.services.compatibility import CompatibilityEngine, LAYOUT_CODES, MISSING
+
+# 레이아웃별 스위치 수량 (프론트 builder getSwitchCount와 동일)
+SWITCH_COUNTS = {
+    LayoutType.SIXTY: 61,
+    LayoutType.SIXTY_FIVE: 68,
+    LayoutType.SEVENTY_FIVE: 84,
+    LayoutType.TKL: 87,
+    LayoutType.FULL: 104,
+}
+_SWITCH_COUNT_BY_CODE = {LAYOUT_CODES[layout]: count for layout, count in SWITCH_COUNTS.items()}
+_MIN_SWITCH_COUNT = min(SWITCH_COUNTS.values())
+
+# 탐색 순서: PCB를 먼저 정해야 스위치 수량과 group 파티션이 결정됨
+SEARCH_ORDER = ("pcb", "plate", "case", "switch", "keycap", "stabilizer")
+
+
+class CheapestBuildSearch:
+    """
+    예산 내 가장 싼 완전 호환 빌드 N개 탐색 (branch and bound)
+    - 후보: 이미 고른 부품의 group/스위치 타입으로 역색인을 교차한 집합 (group 파티션)
+    - 하한: 현재 합계 + 남은 slot별 후보 최저가, 예산이나 현재 N번째 결과를 넘으면 가지치기
+    - 후보 목록은 가격순이므로 하한을 넘는 순간 나머지 후보는 보지 않음
+    """
+
+    def __init__(
+        self,
+        engine: CompatibilityEngine,
+        fixed: Dict[str, int],
+        max_price: Optional[float] = None,
+        limit: int = 5,
+        layout: Optional[LayoutType] = None,
+    ):
+        self.engine = engine
+        self.max_price = math.inf if max_price is None else max_price
+        self.limit = limit
+
+        # slot별 탐색 대상 (고정 부품 / 레이아웃 필터 적용)
+        self.base: Dict[str, frozenset] = {}
+        for slot in SEARCH_ORDER:
+            ids = engine.ids[slot]
+            if fixed.get(slot):
+                ids = ids & {fixed[slot]}
+            if layout is not None and slot in engine.layout:
+                arr, code = engine.layout[slot], LAYOUT_CODES[layout]
+                ids = frozenset(i for i in ids if arr[i] == code)
+            self.base[slot] = ids
+
+        self._candidates_cache: Dict[tuple, List[Tuple[float, int]]] = {}
+        self._results: List[tuple] = []  # (-합계, 순번, 조합) max-heap
+        self._counter = itertools.count()
+
+    def _codes(self, selection: Dict[str, int]):
+        groups, switches = {}, {}
+        for slot, part_id in selection.items():
+            if slot in self.engine.group:
+                groups[slot] = int(self.engine.group[slot][part_id])
+            if slot in self.engine.switch:
+                switches[slot] = int(self.engine.switch[slot][part_id])
+        return groups, switches
+
+    def _switch_count(self, selection: Dict[str, int]) -> int:
+        pcb_id = selection.get("pcb")
+        if pcb_id is None:
+            return _MIN_SWITCH_COUNT
+        code = int(self.engine.layout["pcb"][pcb_id])
+        return _SWITCH_COUNT_BY_CODE.get(code, 0) if code != MISSING else 0
+
+    def candidates(self, slot: str, selection: Dict[str, int]) -> List[Tuple[float, int]]:
+        """(비용, id) 가격순 목록 - 제약 조건이 같은 경우 재사용"""
+        groups, switches = self._codes(selection)
+        switch_count = self._switch_count(selection) if slot == "switch" else 1
+        key = (slot, tuple(sorted(groups.items())), tuple(sorted(switches.items())), switch_count)
+        cached = self._candidates_cache.get(key)
+        if cached is None:
+            allowed = self.engine.allowed_ids(slot, groups, switches, self.base[slot])
+            prices = self.engine.price[slot]
+            cached = sorted((prices[i] * switch_count, i) for i in allowed)
+            self._candidates_cache[key] = cached
+        return cached
+
+    def _lower_bound(self, slots, selection: Dict[str, int]) -> float:
+        bound = 0.0
+        for slot in slots:
+            candidates = self.candidates(slot, selection)
+            if not candidates:
+                return math.inf
+            bound += candidates[0][0]
+        return bound
+
+    def _is_pruned(self, bound: float) -> bool:
+        if bound > self.max_price:
+            return True
+        return len(self._results) >= self.limit and bound >= -self._results[0][0]
+
+    def _search(self, depth: int, selection: Dict[str, int], cost: float):
+        if depth == len(SEARCH_ORDER):
+            entry = (-cost, next(self._counter), dict(selection))
+            if len(self._results) < self.limit:
+                heapq.heappush(self._results, entry)
+            else:
+                heapq.heappushpop(self._results, entry)
+            return
+
+        slot = SEARCH_ORDER[depth]
+        rest = SEARCH_ORDER[depth + 1:]
+        # 어떤 후보를 고르든 성립하는 하한 (후보 선택 전 기준)
+        rest_bound = self._lower_bound(rest, selection)
+        if rest_bound == math.inf:
+            return
+
+        for part_cost, part_id in self.candidates(slot, selection):
+            if self._is_pruned(cost + part_cost + rest_bound):
+                break
+            selection[slot] = part_id
+            if not self._is_pruned(cost + part_cost + self._lower_bound(rest, selection)):
+                self._search(depth + 1, selection, cost + part_cost)
+            del selection[slot]
+
+    def run(self) -> List[dict]:
+        self._search(0, {}, 0.0)
+        results = sorted(self._results, key=lambda entry: (-entry[0], entry[1]))
+        return [
+            {"total_price": round(-neg_cost, 2), **{f"{slot}_id": combo[slot] for slot in SEARCH_ORDER}}
+            for neg_cost, _, combo in results
+        ]
@@ -0,0 +1,91 @@
+import gzip
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Response
+from sqlalchemy.orm import Session, joinedload
+
+from app.models import PCB, Case, Plate, Stabilizer, Switch, Keycap, CompatibleGroup
+from app.schemas import AllPartsResponse
+from app.services.serializers import serialize_part
+from app.services.versions import get_version, load_version
+
+# 카탈로그 스냅샷이 의존하는 테이블
+PART_TABLES = (
+    PCB.__tablename__, Case.__tablename__, Plate.__tablename__,
+    Stabilizer.__tablename__, Switch.__tablename__, Keycap.__tablename__,
+    CompatibleGroup.__tablename__,
+)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: int
+    body: bytes
+    gzip_body: bytes
+
+    def to_response(self, accept_encoding: str = "", headers: Optional[dict] = None) -> Response:
+        headers = {**(headers or {}), "Vary": "Accept-Encoding", "X-Catalog-Version": str(self.version)}
+        if _accepts_gzip(accept_encoding):
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=self.gzip_body, media_type="application/json", headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+_snapshot: Optional[CatalogSnapshot] = None
+
+
+def get_catalog_version() -> int:
+    return get_version(*PART_TABLES)
+
+
+def cached_catalog_snapshot() -> Optional[CatalogSnapshot]:
+    """현재 버전의 스냅샷이 있으면 반환 (DB 접근 없음)"""
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.version >= get_catalog_version():
+        return snapshot
+    return None
+
+
+def get_catalog_snapshot(db: Session) -> CatalogSnapshot:
+    """현재 버전의 스냅샷 반환, 부품 테이블이 바뀌었으면 다시 생성"""
+    global _snapshot
+    snapshot = cached_catalog_snapshot()
+    if snapshot is not None:
+        return snapshot
+
+    # 동시에 여러 요청이 다시 만들 수 있지만 결과가 같으므로 lock 없이 교체
+    # (async 모드에서는 DB I/O 도중 event loop 스레드가 lock을 기다리면 교착됨)
+    # 버전은 데이터보다 먼저 같은 세션에서 읽음 (replica가 늦으면 낮은 버전으로 기록되어 다음 요청에서 다시 생성)
+    version = load_version(db, *PART_TABLES)
+    body = AllPartsResponse.model_validate(_load_catalog(db)).model_dump_json().encode()
+    snapshot = CatalogSnapshot(
+        version=version,
+        body=body,
+        gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+    )
+    _snapshot = snapshot
+    return snapshot
+
+
+def _load_catalog(db: Session) -> dict:
+    pcbs = db.query(PCB).options(joinedload(PCB.compatible_group)).all()
+    cases = db.query(Case).options(joinedload(Case.compatible_group)).all()
+    plates = db.query(Plate).options(joinedload(Plate.compatible_group)).all()
+    return {
+        "pcbs": [serialize_part(p) for p in pcbs],
+        "cases": [serialize_part(c) for c in cases],
+        "plates": [serialize_part(p) for p in plates],
+        "stabilizers": db.query(Stabilizer).all(),
+        "switches": db.query(Switch).all(),
+        "keycaps": db.query(Keycap).all(),
+        "compatible_groups": db.query(CompatibleGroup).all(),
+    }
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    for token in accept_encoding.split(","):
+        coding, _, params = token.strip().partition(";")
+        if coding.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
@@ -1,110 +1,178 @@
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session, joinedload
-from app.models import PCB, Case, Plate, Stabilizer, Switch, Keycap
 
-class CompatibilityService:
-    def __init__(self, db: Session):
-        self.db = db
+import numpy as np
+from sqlalchemy.orm import Session
 
-    def check_compatibility(
-        self,
-        pcb_id: Optional[int] = None,
-        case_id: Optional[int] = None,
-        plate_id: Optional[int] = None,
-        switch_id: Optional[int] = None,
-        keycap_id: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        issues = []
+from app.models import PCB, Case, Plate, Stabilizer, Switch, Keycap, CompatibleGroup
+from app.models.parts import LayoutType, SwitchType
+from app.services.versions import get_version, load_version
 
-        pcb = self.db.query(PCB).options(joinedload(PCB.compatible_group)).filter(PCB.id == pcb_id).first() if pcb_id else None
-        case = self.db.query(Case).options(joinedload(Case.compatible_group)).filter(Case.id == case_id).first() if case_id else None
-        plate = self.db.query(Plate).options(joinedload(Plate.compatible_group)).filter(Plate.id == plate_id).first() if plate_id else None
-        switch = self.db.query(Switch).filter(Switch.id == switch_id).first() if switch_id else None
-        keycap = self.db.query(Keycap).filter(Keycap.id == keycap_id).first() if keycap_id else None
+# 엔진이 의존하는 테이블 (이 테이블들이 바뀌면 재생성)
+ENGINE_TABLES = (
+    PCB.__tablename__, Case.__tablename__, Plate.__tablename__, Stabilizer.__tablename__,
+    Switch.__tablename__, Keycap.__tablename__, CompatibleGroup.__tablename__,
+)
 
-        # --- 물리적 호환성: compatible_group 기반 ---
+# slot 이름 -> 응답 key
+SLOT_KEYS = {
+    "pcb": "pcbs", "case": "cases", "plate": "plates",
+    "stabilizer": "stabilizers", "switch": "switches", "keycap": "keycaps",
+}
 
-        # PCB <--> Case: 같은 compatible_group이면 호환
-        if pcb and case:
-            if pcb.compatible_group_id and case.compatible_group_id:
-                if pcb.compatible_group_id != case.compatible_group_id:
-                    pcb_group = pcb.compatible_group.name if pcb.compatible_group else "?"
-                    case_group = case.compatible_group.name if case.compatible_group else "?"
-                    issues.append({
-                        "type": "error",
-                        "parts": ["PCB", "Case"],
-                        "message": f"호환 그룹 불일치: PCB({pcb_group}) vs Case({case_group})"
-                    })
-            else:
-                issues.append({
-                    "type": "warning",
-                    "parts": ["PCB", "Case"],
-                    "message": "호환 그룹 미지정 - 물리적 호환성 확인 불가"
-                })
+# 스위치 타입 정수 코드 (0 = 없음)
+SWITCH_TYPES = list(SwitchType)
+SWITCH_CODES = {t: i + 1 for i, t in enumerate(SWITCH_TYPES)}
 
-        # PCB <--> Plate: 같은 compatible_group이면 호환
-        if pcb and plate:
-            if pcb.compatible_group_id and plate.compatible_group_id:
-                if pcb.compatible_group_id != plate.compatible_group_id:
-                    pcb_group = pcb.compatible_group.name if pcb.compatible_group else "?"
-                    plate_group = plate.compatible_group.name if plate.compatible_group else "?"
-                    issues.append({
-                        "type": "error",
-                        "parts": ["PCB", "Plate"],
-                        "message": f"호환 그룹 불일치: PCB({pcb_group}) vs Plate({plate_group})"
-                    })
-            else:
-                issues.append({
-                    "type": "warning",
-                    "parts": ["PCB", "Plate"],
-                    "message": "호환 그룹 미지정 - 물리적 호환성 확인 불가"
-                })
+# 레이아웃 정수 코드
+LAYOUTS = list(LayoutType)
+LAYOUT_CODES = {t: i + 1 for i, t in enumerate(LAYOUTS)}
+
+# 부품 id -> 코드 배열에서 "존재하지 않는 부품" 표시
+MISSING = -1
+
+# 물리적 호환성: compatible_group 일치 (slot, slot, label, label)
+GROUP_RULES = [
+    ("pcb", "case", "PCB", "Case"),
+    ("pcb", "plate", "PCB", "Plate"),
+    ("plate", "case", "Plate", "Case"),
+]
 
-        # Plate <--> Case: 같은 compatible_group이면 호환
-        if plate and case:
-            if plate.compatible_group_id and case.compatible_group_id:
-                if plate.compatible_group_id != case.compatible_group_id:
-                    plate_group = plate.compatible_group.name if plate.compatible_group else "?"
-                    case_group = case.compatible_group.name if case.compatible_group else "?"
+# 전기적 호환성: 스위치/스템 타입 일치 (slot, slot, label, label, message prefix)
+SWITCH_RULES = [
+    ("pcb", "switch", "PCB", "Switch", "스위치 타입 불일치"),
+    ("plate", "switch", "Plate", "Switch", "스위치 타입 불일치"),
+    ("switch", "keycap", "Switch", "Keycap", "스템 타입 불일치"),
+]
+
+GROUP_WARNING = "호환 그룹 미지정 - 물리적 호환성 확인 불가"
+
+_EMPTY = frozenset()
+
+
+def _code_array(rows, size: int) -> np.ndarray:
+    """(id, code) 목록을 id로 인덱싱하는 int32 배열로 변환"""
+    arr = np.full(size, MISSING, dtype=np.int32)
+    for part_id, code in rows:
+        arr[part_id] = code
+    return arr
+
+
+def _inverted_index(rows) -> Dict[int, frozenset]:
+    """(id, code) 목록 -> code별 부품 id 집합"""
+    index = defaultdict(set)
+    for part_id, code in rows:
+        index[code].add(part_id)
+    return {code: frozenset(ids) for code, ids in index.items()}
+
+
+class CompatibilityEngine:
+    """
+    부품 속성(compatible_group_id, switch_type, stem_type)을 id로 인덱싱한 정수 배열로 보관
+    - group 배열: compatible_group_id (0 = 그룹 미지정, -1 = 없는 부품)
+    - switch 배열: SWITCH_CODES (-1 = 없는 부품)
+    - 판정은 배열 인덱싱만으로 O(1), DB 접근 없음
+    - 역색인(group -> id, 스위치 타입 -> id)으로 선택 가능한 부품 목록 계산
+    - 가격/레이아웃도 함께 보관 (예산 내 빌드 탐색용)
+    """
+
+    def __init__(self, db: Session, version: int):
+        self.version = version
+        self.group_names: Dict[int, str] = dict(db.query(CompatibleGroup.id, CompatibleGroup.name).all())
+
+        pcbs = db.query(PCB.id, PCB.compatible_group_id, PCB.switch_type, PCB.layout, PCB.price).all()
+        cases = db.query(Case.id, Case.compatible_group_id, Case.layout, Case.price).all()
+        plates = db.query(Plate.id, Plate.compatible_group_id, Plate.switch_type, Plate.layout, Plate.price).all()
+        switches = db.query(Switch.id, Switch.switch_type, Switch.price).all()
+        keycaps = db.query(Keycap.id, Keycap.stem_type, Keycap.price).all()
+        stabilizers = db.query(Stabilizer.id, Stabilizer.price).all()
+
+        def size(rows):
+            return max((r.id for r in rows), default=0) + 1
+
+        self.group = {
+            "pcb": _code_array([(r.id, r.compatible_group_id or 0) for r in pcbs], size(pcbs)),
+            "case": _code_array([(r.id, r.compatible_group_id or 0) for r in cases], size(cases)),
+            "plate": _code_array([(r.id, r.compatible_group_id or 0) for r in plates], size(plates)),
+        }
+        self.switch = {
+            "pcb": _code_array([(r.id, SWITCH_CODES[r.switch_type]) for r in pcbs], size(pcbs)),
+            "plate": _code_array([(r.id, SWITCH_CODES[r.switch_type]) for r in plates], size(plates)),
+            "switch": _code_array([(r.id, SWITCH_CODES[r.switch_type]) for r in switches], size(switches)),
+            "keycap": _code_array([(r.id, SWITCH_CODES[r.stem_type]) for r in keycaps], size(keycaps)),
+        }
+        self.layout = {
+            "pcb": _code_array([(r.id, LAYOUT_CODES[r.layout]) for r in pcbs], size(pcbs)),
+            "case": _code_array([(r.id, LAYOUT_CODES[r.layout]) for r in cases], size(cases)),
+            "plate": _code_array([(r.id, LAYOUT_CODES[r.layout]) for r in plates], size(plates)),
+        }
+        # 가격 미정(NULL)은 0으로 계산 (프론트 합계와 동일)
+        self.price = {
+            "pcb": {r.id: r.price or 0.0 for r in pcbs},
+            "case": {r.id: r.price or 0.0 for r in cases},
+            "plate": {r.id: r.price or 0.0 for r in plates},
+            "stabilizer": {r.id: r.price or 0.0 for r in stabilizers},
+            "switch": {r.id: r.price or 0.0 for r in switches},
+            "keycap": {r.id: r.price or 0.0 for r in keycaps},
+        }
+
+        # 역색인
+        self.ids = {slot: frozenset(prices) for slot, prices in self.price.items()}
+        self.ids_by_group = {
+            slot: _inverted_index((int(i), int(arr[i])) for i in np.flatnonzero(arr != MISSING))
+            for slot, arr in self.group.items()
+        }
+        self.ids_by_switch = {
+            slot: _inverted_index((int(i), int(arr[i])) for i in np.flatnonzero(arr != MISSING))
+            for slot, arr in self.switch.items()
+        }
+
+    @staticmethod
+    def _lookup(arr: np.ndarray, part_id: Optional[int]) -> Optional[int]:
+        if not part_id or part_id < 0 or part_id >= len(arr):
+            return None
+        code = int(arr[part_id])
+        return None if code == MISSING else code
+
+    def _group_name(self, group_id: int) -> str:
+        return self.group_names.get(group_id, "?")
+
+    def check(self, **part_ids: Optional[int]) -> Dict[str, Any]:
+        """slot 이름(pcb, case, plate, switch, keycap) -> 부품 id 로 호환성 판정"""
+        issues: List[Dict[str, Any]] = []
+
+        groups = {slot: self._lookup(arr, part_ids.get(slot)) for slot, arr in self.group.items()}
+        switches = {slot: self._lookup(arr, part_ids.get(slot)) for slot, arr in self.switch.items()}
+
+        # --- 물리적 호환성: compatible_group 기반 ---
+        for a, b, label_a, label_b in GROUP_RULES:
+            group_a, group_b = groups[a], groups[b]
+            if group_a is None or group_b is None:
+                continue
+            if group_a and group_b:
+                if group_a != group_b:
                     issues.append({
                         "type": "error",
-                        "parts": ["Plate", "Case"],
-                        "message": f"호환 그룹 불일치: Plate({plate_group}) vs Case({case_group})"
+                        "parts": [label_a, label_b],
+                        "message": f"호환 그룹 불일치: {label_a}({self._group_name(group_a)}) vs {label_b}({self._group_name(group_b)})"
                     })
             else:
                 issues.append({
                     "type": "warning",
-                    "parts": ["Plate", "Case"],
-                    "message": "호환 그룹 미지정 - 물리적 호환성 확인 불가"
-                })
-
-        # --- 전기적 호환성: 속성 기반 (변경 없음) ---
-
-        # PCB <--> Switch: switch_type 일치
-        if pcb and switch:
-            if pcb.switch_type != switch.switch_type:
-                issues.append({
-                    "type": "error",
-                    "parts": ["PCB", "Switch"],
-                    "message": f"스위치 타입 불일치: PCB({pcb.switch_type.value}) vs Switch({switch.switch_type.value})"
-                })
-
-        # Plate <--> Switch: switch_type 일치
-        if plate and switch:
-            if plate.switch_type != switch.switch_type:
-                issues.append({
-                    "type": "error",
-                    "parts": ["Plate", "Switch"],
-                    "message": f"스위치 타입 불일치: Plate({plate.switch_type.value}) vs Switch({switch.switch_type.value})"
+                    "parts": [label_a, label_b],
+                    "message": GROUP_WARNING,
                 })
 
-        # Switch <--> Keycap: stem_type 일치
-        if switch and keycap:
-            if switch.switch_type != keycap.stem_type:
+        # --- 전기적 호환성: 속성 기반 ---
+        for a, b, label_a, label_b, prefix in SWITCH_RULES:
+            code_a, code_b = switches[a], switches[b]
+            if code_a is None or code_b is None:
+                continue
+            if code_a != code_b:
                 issues.append({
                     "type": "error",
-                    "parts": ["Switch", "Keycap"],
-                    "message": f"스템 타입 불일치: Switch({switch.switch_type.value}) vs Keycap({keycap.stem_type.value})"
+                    "parts": [label_a, label_b],
+                    "message": f"{prefix}: {label_a}({SWITCH_TYPES[code_a - 1].value}) vs {label_b}({SWITCH_TYPES[code_b - 1].value})"
                 })
 
         # compatible 판정: error가 0개면 호환 (warning은 무시)
@@ -114,3 +182,187 @@ class CompatibilityService:
             "compatible": error_count == 0,
             "issues": issues
         }
+
+    def compatible_options(self, **part_ids: Optional[int]) -> Dict[str, List[int]]:
+        """
+        선택되지 않은 slot마다, 현재 선택과 error를 일으키지 않는 부품 id 목록
+        - 그룹이 지정된 부품이 선택되어 있으면: 같은 그룹 + 그룹 미지정(warning만 발생) 부품
+        - 스위치 타입이 정해진 부품이 선택되어 있으면: 같은 타입 부품
+        """
+        groups = {slot: self._lookup(arr, part_ids.get(slot)) for slot, arr in self.group.items()}
+        switches = {slot: self._lookup(arr, part_ids.get(slot)) for slot, arr in self.switch.items()}
+        return {
+            slot: sorted(self.allowed_ids(slot, groups, switches))
+            for slot in self.ids
+            if not part_ids.get(slot)
+        }
+
+    def allowed_ids(
+        self,
+        slot: str,
+        groups: Dict[str, Optional[int]],
+        switches: Dict[str, Optional[int]],
+        base: Optional[frozenset] = None,
+    ) -> frozenset:
+        """이미 고른 부품들의 group/스위치 코드 기준으로 slot에서 error 없이 고를 수 있는 id 집합"""
+        allowed = self.ids[slot] if base is None else base
+        for a, b, *_ in GROUP_RULES:
+            if slot in (a, b):
+                group = groups.get(b if slot == a else a)
+                if group:
+                    by_group = self.ids_by_group[slot]
+                    allowed = allowed & (by_group.get(group, _EMPTY) | by_group.get(0, _EMPTY))
+        for a, b, *_ in SWITCH_RULES:
+            if slot in (a, b):
+                code = switches.get(b if slot == a else a)
+                if code is not None:
+                    allowed = allowed & self.ids_by_switch[slot].get(code, _EMPTY)
+        return allowed
+
+    @staticmethod
+    def _lookup_many(arr: np.ndarray, part_ids: np.ndarray) -> np.ndarray:
+        """부품 id 배열 -> 코드 배열 (id 없음/범위 밖은 MISSING)"""
+        valid = (part_ids > 0) & (part_ids < len(arr))
+        codes = arr[np.where(valid, part_ids, 0)]
+        return np.where(valid, codes, MISSING)
+
+    def check_many(self, part_ids: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+        """
+        check()의 벡터화 버전 - slot 이름 -> 부품 id 배열 (None은 0)
+        - 규칙별 error/warning 마스크를 배열 연산으로 계산
+        - 메시지는 문제가 있는 행에 대해서만 생성, 결과 순서는 입력 순서와 동일
+        """
+        n = len(next(iter(part_ids.values()))) if part_ids else 0
+        empty = np.zeros(n, dtype=np.int64)
+        groups = {slot: self._lookup_many(arr, part_ids.get(slot, empty)) for slot, arr in self.group.items()}
+        switches = {slot: self._lookup_many(arr, part_ids.get(slot, empty)) for slot, arr in self.switch.items()}
+
+        results = [{"compatible": True, "issues": []} for _ in range(n)]
+        has_error = np.zeros(n, dtype=bool)
+
+        # --- 물리적 호환성: compatible_group 기반 ---
+        for a, b, label_a, label_b in GROUP_RULES:
+            group_a, group_b = groups[a], groups[b]
+            present = (group_a != MISSING) & (group_b != MISSING)
+            assigned = (group_a > 0) & (group_b > 0)
+            errors = present & assigned & (group_a != group_b)
+            warnings = present & ~assigned
+            has_error |= errors
+            # 행별 issue 순서를 check()와 맞추기 위해 error/warning을 한 번에 순회
+            for i in np.flatnonzero(errors | warnings):
+                if errors[i]:
+                    results[i]["issues"].append({
+                        "type": "error",
+                        "parts": [label_a, label_b],
+                        "message": f"호환 그룹 불일치: {label_a}({self._group_name(int(group_a[i]))}) vs {label_b}({self._group_name(int(group_b[i]))})"
+                    })
+                else:
+                    results[i]["issues"].append({
+                        "type": "warning",
+                        "parts": [label_a, label_b],
+                        "message": GROUP_WARNING,
+                    })
+
+        # --- 전기적 호환성: 속성 기반 ---
+        for a, b, label_a, label_b, prefix in SWITCH_RULES:
+            code_a, code_b = switches[a], switches[b]
+            errors = (code_a != MISSING) & (code_b != MISSING) & (code_a != code_b)
+            has_error |= errors
+            for i in np.flatnonzero(errors):
+                results[i]["issues"].append({
+                    "type": "error",
+                    "parts": [label_a, label_b],
+                    "message": f"{prefix}: {label_a}({SWITCH_TYPES[code_a[i] - 1].value}) vs {label_b}({SWITCH_TYPES[code_b[i] - 1].value})"
+                })
+
+        for i in np.flatnonzero(has_error):
+            results[i]["compatible"] = False
+        return results
+
+
+_engine: Optional[CompatibilityEngine] = None
+
+
+def get_compatibility_engine(db: Session) -> CompatibilityEngine:
+    """현재 부품 버전의 엔진 반환, 부품 테이블이 바뀌었으면 다시 생성"""
+    global _engine
+    engine = _engine
+    if engine is not None and engine.version >= get_version(*ENGINE_TABLES):
+        return engine
+
+    # catalog 스냅샷과 마찬가지로 lock 없이 교체 (중복 생성은 무해)
+    # 버전은 부품보다 먼저 같은 세션에서 읽음 (DB 기준 table_versions, app.services.versions)
+    engine = CompatibilityEngine(db, load_version(db, *ENGINE_TABLES))
+    _engine = engine
+    return engine
+
+
+class CompatibilityService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def check_compatibility(
+        self,
+        pcb_id: Optional[int] = None,
+        case_id: Optional[int] = None,
+        plate_id: Optional[int] = None,
+        switch_id: Optional[int] = None,
+        keycap_id: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        engine = get_compatibility_engine(self.db)
+        return engine.check(
+            pcb=pcb_id,
+            case=case_id,
+            plate=plate_id,
+            switch=switch_id,
+            keycap=keycap_id,
+        )
+
+    def compatible_options(
+        self,
+        pcb_id: Optional[int] = None,
+        case_id: Optional[int] = None,
+        plate_id: Optional[int] = None,
+        stabilizer_id: Optional[int] = None,
+        switch_id: Optional[int] = None,
+        keycap_id: Optional[int] = None,
+    ) -> Dict[str, List[int]]:
+        engine = get_compatibility_engine(self.db)
+        options = engine.compatible_options(
+            pcb=pcb_id,
+            case=case_id,
+            plate=plate_id,
+            stabilizer=stabilizer_id,
+            switch=switch_id,
+            keycap=keycap_id,
+        )
+        return {SLOT_KEYS[slot]: ids for slot, ids in options.items()}
+
+    def cheapest_builds(
+        self,
+        fixed: Dict[str, Optional[int]],
+        max_price: Optional[float] = None,
+        limit: int = 5,
+        layout: Optional[LayoutType] = None,
+    ) -> List[Dict[str, Any]]:
+        """고정 부품(slot -> id)을 포함하는 예산 내 최저가 완전 호환 조합"""
+        from app.services.build_search import CheapestBuildSearch
+
+        engine = get_compatibility_engine(self.db)
+        search = CheapestBuildSearch(
+            engine,
+            fixed={slot: part_id for slot, part_id in fixed.items() if part_id},
+            max_price=max_price,
+            limit=limit,
+            layout=layout,
+        )
+        return search.run()
+
+    def check_compatibility_batch(self, items: List[Dict[str, Optional[int]]]) -> List[Dict[str, Any]]:
+        """*_id dict 목록을 한 번에 판정, 입력 순서대로 결과 반환"""
+        engine = get_compatibility_engine(self.db)
+        part_ids = {
+            slot: np.fromiter((item.get(f"{slot}_id") or 0 for item in items), dtype=np.int64, count=len(items))
+            for slot in ("pcb", "case", "plate", "switch", "keycap")
+        }
+        return engine.check_many(part_ids)
@@ -0,0 +1,58 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.models import Post, Comment, PostLike, Build, BuildLike
+
+
+def reconcile_comment_counts(db: Session) -> int:
+    """
+    posts.comment_count를 실제 댓글 수(답글 포함)로 맞춤
+    - 신규 컬럼 backfill 및 주기적 보정용 (증감 누락/수동 데이터 수정 대비)
+    - 값이 다른 게시글만 UPDATE, 수정된 게시글 수 반환
+    """
+    actual = (
+        sa.select(sa.func.count(Comment.id))
+        .where(Comment.post_id == Post.id)
+        .scalar_subquery()
+    )
+    result = db.execute(
+        sa.update(Post)
+        .where(Post.comment_count.is_distinct_from(actual))
+        .values(comment_count=actual, updated_at=Post.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def reconcile_like_counts(db: Session, model, like_fk) -> int:
+    """
+    model.like_count를 좋아요 테이블의 실제 행 수로 맞춤
+    - like_count는 write-behind로 반영되므로 프로세스가 flush 전에 종료되면 증감이 유실될 수 있음
+    - 예: reconcile_like_counts(db, Post, PostLike.post_id)
+    """
+    actual = (
+        sa.select(sa.func.count())
+        .where(like_fk == model.id)
+        .scalar_subquery()
+    )
+    result = db.execute(
+        sa.update(model)
+        .where(model.like_count.is_distinct_from(actual))
+        .values(like_count=actual, updated_at=model.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+if __name__ == "__main__":
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        print(f"Reconciled comment_count on {reconcile_comment_counts(db)} posts")
+        print(f"Reconciled like_count on {reconcile_like_counts(db, Post, PostLike.post_id)} posts")
+        print(f"Reconciled like_count on {reconcile_like_counts(db, Build, BuildLike.build_id)} builds")
+    finally:
+        db.close()
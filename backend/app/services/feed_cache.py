@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from app.database import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCacheBackend:
+    """프로세스 내 LRU + TTL 저장소 (기본, worker마다 따로 가짐)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._counters: Dict[str, int] = {}  # generation 카운터는 LRU로 밀려나지 않게 따로 보관
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key in self._counters:
+                return str(self._counters[key]).encode()
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+
+class RedisCacheBackend:
+    """
+    Redis(호환) 저장소 - worker/서버 간 캐시와 무효화 공유
+    - redis 패키지는 build_feed_cache_url을 설정할 때만 필요
+    - async 모드에서도 sync client를 쓰므로 짧은 timeout으로 event loop 점유를 제한
+    """
+
+    def __init__(self, url: str, timeout: float = 0.1):
+        import redis
+
+        self._client = redis.Redis.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self._client.set(key, value, px=max(1, int(ttl * 1000)))
+
+    def incr(self, key: str) -> int:
+        return self._client.incr(key)
+
+
+class FeedCache:
+    """
+    익명 사용자 기준으로 직렬화된 피드 응답(JSON bytes) 캐시
+    - 키: namespace + generation + endpoint + 파라미터, invalidate()는 generation만 올림
+      (조회 도중 무효화되면 이전 generation 키로 저장되므로 오래된 값이 다시 읽히지 않음)
+    - 사용자별 값(is_liked 등)은 캐시하지 않고 호출 측에서 덧씌움
+    - 저장소 오류 시 캐시 없이 DB 조회 결과를 그대로 사용
+    - 프로세스 내 LRU면 다른 worker의 무효화는 ttl 이내에 반영
+    """
+
+    def __init__(self, backend, namespace: str, ttl: float):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self._generation_key = f"{namespace}:generation"
+
+    def get_or_load(self, key: str, load: Callable[[], bytes]) -> bytes:
+        try:
+            generation = int(self.backend.get(self._generation_key) or 0)
+            full_key = f"{self.namespace}:{generation}:{key}"
+            body = self.backend.get(full_key)
+        except Exception:
+            logger.warning("feed cache %s unavailable", self.namespace, exc_info=True)
+            return load()
+        if body is not None:
+            return body
+
+        body = load()
+        try:
+            self.backend.set(full_key, body, self.ttl)
+        except Exception:
+            logger.warning("feed cache %s store failed", self.namespace, exc_info=True)
+        return body
+
+    def invalidate(self):
+        try:
+            self.backend.incr(self._generation_key)
+        except Exception:
+            logger.warning("feed cache %s invalidate failed", self.namespace, exc_info=True)
+
+
+def _make_backend():
+    if settings.build_feed_cache_url:
+        return RedisCacheBackend(settings.build_feed_cache_url)
+    return LRUCacheBackend(settings.build_feed_cache_max_size)
+
+
+# 공개 빌드 피드 (/api/builds/popular, /api/builds/recent)
+# - 빌드 생성/수정/삭제(공개 빌드이거나 공개 여부가 바뀐 경우), 좋아요 수 반영, hot score 재계산,
+#   닉네임 변경/탈퇴 시 무효화
+build_feed_cache = FeedCache(_make_backend(), namespace="build-feed", ttl=settings.build_feed_cache_ttl_seconds)
@@ -0,0 +1,92 @@
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.services.scheduler import LeaderLock
+
+# hot score = 좋아요 수 / (경과 시간(h) + AGE_OFFSET_HOURS) ^ GRAVITY
+# - 좋아요가 바뀔 때 해당 행만 갱신 (app.services.likes), 시간 경과분은 주기 작업(refresh_hot_scores)으로 반영
+# - HOT_WINDOW보다 오래된 글은 0 (인기 피드에서 제외)
+GRAVITY = 1.5
+AGE_OFFSET_HOURS = 2.0
+HOT_WINDOW = timedelta(days=30)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def decay_weight(created_at: Optional[datetime], now: Optional[datetime] = None) -> float:
+    """좋아요 1개당 점수 (시간이 지날수록 감소)"""
+    now = now or _utcnow()
+    if created_at is None:
+        created_at = now
+    elif created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    age = now - created_at
+    if age > HOT_WINDOW:
+        return 0.0
+    hours = max(age.total_seconds(), 0.0) / 3600
+    return 1.0 / math.pow(hours + AGE_OFFSET_HOURS, GRAVITY)
+
+
+def hot_score(like_count: Optional[int], created_at: Optional[datetime], now: Optional[datetime] = None) -> float:
+    return (like_count or 0) * decay_weight(created_at, now)
+
+
+def hot_score_expr(table, now: datetime):
+    """hot_score()와 같은 식의 SQL 표현 (PostgreSQL) - 행을 읽지 않고 UPDATE 한 번으로 재계산"""
+    now = sa.bindparam("now", now, type_=sa.DateTime(timezone=True))
+    hours = sa.func.greatest(sa.extract("epoch", now - table.c.created_at) / 3600, 0)
+    return sa.func.coalesce(table.c.like_count, 0) / sa.func.power(hours + AGE_OFFSET_HOURS, GRAVITY)
+
+
+def refresh_hot_scores(db: Session, model) -> int:
+    """
+    model(Post/Build)의 hot_score 재계산 (시간 감쇠 반영)
+    - HOT_WINDOW 안의 행은 set-based UPDATE 한 번으로 다시 계산, 벗어난 행은 0으로
+    - updated_at은 그대로 유지 (점수 갱신은 내용 수정이 아님)
+    """
+    now = _utcnow()
+    cutoff = now - HOT_WINDOW
+    table = model.__table__
+    refreshed = db.execute(
+        sa.update(table)
+        .where(table.c.created_at >= cutoff)
+        .values(hot_score=hot_score_expr(table, now), updated_at=table.c.updated_at)
+    ).rowcount
+    expired = db.execute(
+        sa.update(table)
+        .where(table.c.created_at < cutoff, table.c.hot_score != 0)
+        .values(hot_score=0, updated_at=table.c.updated_at)
+    ).rowcount
+    db.commit()
+    return refreshed + expired
+
+
+# 여러 worker 중 lock을 잡은 한 프로세스만 재계산
+hot_score_leader = LeaderLock("hot_score_refresh")
+
+
+def refresh_all_hot_scores():
+    from app.database import SessionLocal
+    from app.models import Post, Build
+    from app.services.feed_cache import build_feed_cache
+
+    if not hot_score_leader.held():
+        return
+    db = SessionLocal()
+    try:
+        refresh_hot_scores(db, Post)
+        if refresh_hot_scores(db, Build):
+            build_feed_cache.invalidate()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    refresh_all_hot_scores()
+    print("Refreshed hot scores")
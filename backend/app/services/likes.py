@@ -0,0 +1,186 @@
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, NamedTuple, Optional, Set, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import Post, Build, PostLike, BuildLike
+from app.services.versions import mark_changed
+
+
+def resolve_liked_ids(db: Session, like_fk, user_id: Optional[int], ids: Iterable[int]) -> Set[int]:
+    """
+    ids 중 user_id가 좋아요한 id 집합
+    - 화면에 있는 id만 IN으로 조회 (사용자의 전체 좋아요 목록을 읽지 않음)
+    - (user_id, 대상 id) unique index로 처리되므로 좋아요를 많이 누른 사용자도 비용이 같음
+    - like_fk: PostLike.post_id / BuildLike.build_id
+    """
+    ids = {i for i in ids if i is not None}
+    if user_id is None or not ids:
+        return set()
+    like_model = like_fk.class_
+    rows = db.query(like_fk).filter(like_model.user_id == user_id, like_fk.in_(ids)).all()
+    return {row[0] for row in rows}
+
+
+async def resolve_liked_ids_async(db: AsyncSession, like_fk, user_id: Optional[int], ids: Iterable[int]) -> Set[int]:
+    """resolve_liked_ids의 AsyncSession 버전 (async 핸들러용)"""
+    ids = {i for i in ids if i is not None}
+    if user_id is None or not ids:
+        return set()
+    like_model = like_fk.class_
+    result = await db.execute(sa.select(like_fk).where(like_model.user_id == user_id, like_fk.in_(ids)))
+    return set(result.scalars())
+
+
+def liked_post_ids(db: Session, user_id: Optional[int], post_ids: Iterable[int]) -> Set[int]:
+    return resolve_liked_ids(db, PostLike.post_id, user_id, post_ids)
+
+
+def liked_build_ids(db: Session, user_id: Optional[int], build_ids: Iterable[int]) -> Set[int]:
+    return resolve_liked_ids(db, BuildLike.build_id, user_id, build_ids)
+
+
+class LikeToggle(NamedTuple):
+    liked: bool
+    delta: int  # like_count 증감 (-1 / 0 / +1)
+    like_count: int  # DB에 반영된 like_count (버퍼의 미반영 증감 제외)
+    created_at: Optional[datetime]  # hot score weight 계산용
+
+
+def toggle_like(db: Session, like_fk, user_id: int, row_id: int, *conditions) -> Optional[LikeToggle]:
+    """
+    좋아요 토글을 SQL 한 번으로 처리 (PostgreSQL 전용, data-modifying CTE)
+    - target: 대상 행 (없거나 conditions를 만족하지 않으면 None -> 404)
+    - removed: 이미 좋아요한 경우 DELETE ... RETURNING
+    - added: 지운 행이 없으면 INSERT ... ON CONFLICT DO NOTHING RETURNING
+      (동시에 같은 좋아요가 먼저 들어가 충돌하면 둘 다 비어 있음 -> 좋아요 상태 유지, 증감 0)
+    - like_fk: PostLike.post_id / BuildLike.build_id
+    - commit은 호출하는 쪽에서
+    """
+    like_table = like_fk.class_.__table__
+    parent = list(like_fk.property.columns[0].foreign_keys)[0].column.table
+    fk = like_table.c[like_fk.key]
+
+    target = (
+        sa.select(parent.c.id, parent.c.like_count, parent.c.created_at)
+        .where(parent.c.id == row_id, *conditions)
+        .cte("target")
+    )
+    removed = (
+        sa.delete(like_table)
+        .where(like_table.c.user_id == user_id, fk.in_(sa.select(target.c.id)))
+        .returning(fk)
+        .cte("removed")
+    )
+    added = (
+        pg_insert(like_table)
+        .from_select(
+            ["user_id", fk.key],
+            sa.select(sa.literal(user_id), target.c.id).where(~sa.exists(sa.select(removed.c[fk.key]))),
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", fk.key])
+        .returning(fk)
+        .cte("added")
+    )
+    row = db.execute(
+        sa.select(
+            target.c.like_count,
+            target.c.created_at,
+            sa.exists(sa.select(added.c[fk.key])).label("added"),
+            sa.exists(sa.select(removed.c[fk.key])).label("removed"),
+        )
+    ).first()
+    if row is None:
+        return None
+
+    # SELECT로 실행되므로 versions 이벤트가 잡지 못함 -> 직접 기록
+    mark_changed(db, like_table.name)
+    if row.removed:
+        liked, delta = False, -1
+    else:
+        liked, delta = True, 1 if row.added else 0
+    return LikeToggle(liked, delta, row.like_count or 0, row.created_at)
+
+
+class LikeCounterBuffer:
+    """
+    좋아요 수 write-behind 버퍼
+    - 좋아요 행(post_likes/build_likes)은 요청에서 바로 commit, 부모 행의 like_count 증감만 메모리에 모음
+    - flush()가 모인 증감을 행마다 하나로 합쳐 executemany UPDATE 한 번으로 반영
+      -> 인기 글에 좋아요가 몰려도 부모 행 lock을 요청마다 잡지 않음
+    - 응답의 like_count는 DB 값 + 아직 반영 안 된 증감 (근사값)
+    - lock은 dict 조작에만 사용 (DB I/O 중에는 잡지 않음)
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._pending: Dict[int, Tuple[int, float]] = {}  # id -> (증감, hot score weight)
+        self._lock = threading.Lock()
+
+    def add(self, row_id: int, delta: int, weight: float):
+        with self._lock:
+            pending, _ = self._pending.get(row_id, (0, weight))
+            self._pending[row_id] = (pending + delta, weight)
+
+    def pending(self, row_id: int) -> int:
+        return self._pending.get(row_id, (0, 0.0))[0]
+
+    def _drain(self) -> Dict[int, Tuple[int, float]]:
+        with self._lock:
+            drained, self._pending = self._pending, {}
+        return drained
+
+    def _restore(self, drained: Dict[int, Tuple[int, float]]):
+        with self._lock:
+            for row_id, (delta, weight) in drained.items():
+                pending, _ = self._pending.get(row_id, (0, weight))
+                self._pending[row_id] = (pending + delta, weight)
+
+    def flush(self, db: Session) -> int:
+        """모인 증감을 DB에 반영, 실패하면 버퍼에 되돌리고 예외 전달"""
+        drained = {row_id: entry for row_id, entry in self._drain().items() if entry[0] != 0}
+        if not drained:
+            return 0
+        table = self.model.__table__
+        like_count = sa.func.greatest(0, table.c.like_count + sa.bindparam("delta"))
+        try:
+            db.execute(
+                sa.update(table)
+                .where(table.c.id == sa.bindparam("row_id"))
+                .values(
+                    like_count=like_count,
+                    hot_score=like_count * sa.bindparam("weight"),
+                    updated_at=table.c.updated_at,  # 좋아요는 내용 수정이 아님
+                ),
+                [
+                    {"row_id": row_id, "delta": delta, "weight": weight}
+                    for row_id, (delta, weight) in drained.items()
+                ],
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            self._restore(drained)
+            raise
+        return len(drained)
+
+
+post_like_counter = LikeCounterBuffer(Post)
+build_like_counter = LikeCounterBuffer(Build)
+
+
+def flush_like_counters():
+    from app.database import SessionLocal
+    from app.services.feed_cache import build_feed_cache
+
+    db = SessionLocal()
+    try:
+        post_like_counter.flush(db)
+        if build_like_counter.flush(db):
+            build_feed_cache.invalidate()
+    finally:
+        db.close()
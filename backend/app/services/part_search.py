@@ -0,0 +1,170 @@
+import bisect
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session, joinedload
+
+from app.models import PCB, Case, Plate, Stabilizer, Switch, Keycap
+from app.services.catalog import PART_TABLES, get_catalog_version
+from app.services.serializers import serialize_part
+from app.services.versions import load_version
+
+# (category, model) - 검색 결과 정렬에서 같은 가격이면 이 순서
+PART_CATEGORIES = (
+    ("pcbs", PCB),
+    ("cases", Case),
+    ("plates", Plate),
+    ("stabilizers", Stabilizer),
+    ("switches", Switch),
+    ("keycaps", Keycap),
+)
+CATEGORY_NAMES = tuple(name for name, _ in PART_CATEGORIES)
+
+# 값 목록 필터 + facet count 대상 (category 외에는 부품 column 이름, 해당 column이 없는 부품은 값 없음)
+FACETS = ("category", "layout", "mounting_type", "switch_type", "hotswap", "rgb", "material", "profile")
+# 범위 필터 대상 column
+RANGES = ("price", "actuation_force")
+SORTS = ("price_asc", "price_desc")
+
+
+def facet_value(value) -> Optional[str]:
+    """facet 값 정규화 (Enum -> value, bool -> 'true'/'false')"""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return getattr(value, "value", value)
+
+
+class PartSearchIndex:
+    """
+    카탈로그 전체를 column 단위로 메모리에 올린 검색 인덱스
+    - facet 값마다 행 수 길이의 bool 배열(bitset), 필터는 bitset AND/OR만으로 계산
+    - facet count: 해당 facet을 제외한 나머지 필터 결과와 값별 bitset의 교집합 크기
+      (선택한 값 외의 다른 값을 골랐을 때의 개수도 보여줌)
+    - 정렬별로 행 순서(order)와 정렬 키를 미리 만들어 두고 cursor는 마지막 행의 정렬 키
+    - 부품 테이블이 바뀌면 catalog 버전 기준으로 새로 생성
+    """
+
+    def __init__(self, db: Session, version: int):
+        self.version = version
+        self.items: List[dict] = []
+        values: Dict[str, list] = {facet: [] for facet in FACETS}
+        numbers: Dict[str, list] = {column: [] for column in RANGES}
+        category_codes, ids = [], []
+
+        for code, (category, model) in enumerate(PART_CATEGORIES):
+            query = db.query(model)
+            if hasattr(model, "compatible_group"):
+                query = query.options(joinedload(model.compatible_group))
+            for part in query.order_by(model.id).all():
+                data = serialize_part(part)
+                self.items.append({"category": category, "part": data})
+                values["category"].append(category)
+                for facet in FACETS[1:]:
+                    values[facet].append(facet_value(data.get(facet)))
+                for column in RANGES:
+                    number = data.get(column)
+                    numbers[column].append(math.nan if number is None else float(number))
+                category_codes.append(code)
+                ids.append(part.id)
+
+        self.size = len(self.items)
+        self.bitsets: Dict[str, Dict[str, np.ndarray]] = {}
+        for facet in FACETS:
+            column = np.array(values[facet], dtype=object)
+            distinct = sorted({v for v in values[facet] if v is not None})
+            self.bitsets[facet] = {value: column == value for value in distinct}
+        # 값이 없는 부품(NaN)은 어떤 범위 비교에서도 False
+        self.numbers = {column: np.array(numbers[column], dtype=np.float64) for column in RANGES}
+
+        price = self.numbers["price"]
+        self.orders: Dict[str, np.ndarray] = {}
+        self.sort_keys: Dict[str, List[Tuple[float, int, int]]] = {}
+        for sort in SORTS:
+            sign = 1.0 if sort == "price_asc" else -1.0
+            keys = [
+                (sign * p if not math.isnan(p) else math.inf, code, part_id)  # 가격 없는 부품은 마지막
+                for p, code, part_id in zip(price.tolist(), category_codes, ids)
+            ]
+            order = sorted(range(self.size), key=keys.__getitem__)
+            self.orders[sort] = np.array(order, dtype=np.int64)
+            self.sort_keys[sort] = [keys[i] for i in order]
+
+    def _facet_mask(self, facet: str, selected: Iterable[str]) -> np.ndarray:
+        mask = np.zeros(self.size, dtype=bool)
+        for value in selected:
+            bits = self.bitsets[facet].get(value)
+            if bits is not None:
+                mask |= bits
+        return mask
+
+    def _range_mask(self, ranges: Dict[str, Tuple[Optional[float], Optional[float]]]) -> np.ndarray:
+        mask = np.ones(self.size, dtype=bool)
+        for column, (low, high) in ranges.items():
+            if low is not None:
+                mask &= self.numbers[column] >= low
+            if high is not None:
+                mask &= self.numbers[column] <= high
+        return mask
+
+    def search(
+        self,
+        filters: Dict[str, Iterable[str]],
+        ranges: Dict[str, Tuple[Optional[float], Optional[float]]],
+        sort: str = "price_asc",
+        after: Optional[Tuple[float, int, int]] = None,
+        limit: int = 24,
+    ) -> dict:
+        """
+        filters: facet -> 선택 값 목록 (같은 facet 안은 OR, facet끼리는 AND)
+        ranges: column -> (최소, 최대)
+        after: 이전 페이지 마지막 행의 정렬 키 (cursor)
+        """
+        masks = {facet: self._facet_mask(facet, selected) for facet, selected in filters.items() if selected}
+        base = self._range_mask(ranges)
+
+        def combined(exclude: Optional[str] = None) -> np.ndarray:
+            mask = base.copy()
+            for facet, facet_mask in masks.items():
+                if facet != exclude:
+                    mask &= facet_mask
+            return mask
+
+        result = combined()
+        facets = {}
+        for facet in FACETS:
+            scope = combined(exclude=facet) if facet in masks else result
+            facets[facet] = {
+                value: int(np.count_nonzero(bits & scope)) for value, bits in self.bitsets[facet].items()
+            }
+
+        order, keys = self.orders[sort], self.sort_keys[sort]
+        start = bisect.bisect_right(keys, tuple(after)) if after is not None else 0
+        hits = np.flatnonzero(result[order[start:]])
+        page = hits[:limit] + start
+        next_key = keys[page[-1]] if len(hits) > limit else None
+        return {
+            "items": [self.items[i] for i in order[page]],
+            "facets": facets,
+            "total": int(np.count_nonzero(result)),
+            "next_key": next_key,
+        }
+
+
+_index: Optional[PartSearchIndex] = None
+
+
+def get_part_search_index(db: Session) -> PartSearchIndex:
+    """
+    현재 catalog 버전의 검색 인덱스 반환 (compatibility 엔진과 같은 방식으로 lock 없이 교체)
+    - 버전은 카탈로그 스냅샷처럼 데이터보다 먼저 같은 세션에서 읽어 라벨로 사용
+    """
+    global _index
+    index = _index
+    if index is not None and index.version >= get_catalog_version():
+        return index
+    index = PartSearchIndex(db, load_version(db, *PART_TABLES))
+    _index = index
+    return index
@@ -0,0 +1,96 @@
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """
+    interval(초)마다 func를 실행하는 daemon 스레드
+    - interval <= 0이면 시작하지 않음 (다른 worker/cron에서 실행하는 경우)
+    - 실행 중 예외는 로그만 남기고 다음 주기에 다시 실행
+    """
+
+    def __init__(self, name: str, interval: float, func: Callable[[], None]):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.func()
+            except Exception:
+                logger.exception("periodic task %s failed", self.name)
+
+
+class LeaderLock:
+    """
+    여러 worker 중 한 프로세스만 주기 작업을 실행하도록 하는 PostgreSQL session advisory lock
+    - lock을 얻은 worker가 전용 연결을 계속 잡고 있는 동안 owner (다른 worker는 건너뜀)
+    - owner가 죽으면 연결이 끊기면서 lock이 풀리고, 다음 주기에 다른 worker가 이어받음
+    - PostgreSQL이 아니면 (개발용 sqlite 등) 항상 owner
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def held(self) -> bool:
+        from sqlalchemy import text
+        from app.database import engine
+
+        if engine.dialect.name != "postgresql":
+            return True
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.execute(text("SELECT 1"))
+                    self._conn.commit()
+                    return True
+                except Exception:
+                    logger.warning("lost leader lock %s, retrying", self.name)
+                    self._conn.invalidate()  # 서버 쪽 세션이 끊겨 lock도 풀린 상태
+                    self._conn.close()
+                    self._conn = None
+
+            conn = engine.connect()
+            try:
+                acquired = conn.execute(
+                    text("SELECT pg_try_advisory_lock(hashtext(:name))"), {"name": self.name}
+                ).scalar()
+                conn.commit()  # lock은 세션 단위라 트랜잭션을 닫아도 유지됨 (idle in transaction 방지)
+            except Exception:
+                conn.close()
+                raise
+            if not acquired:
+                conn.close()
+                return False
+            self._conn = conn
+            return True
+
+    def release(self):
+        with self._lock:
+            if self._conn is None:
+                return
+            # pool로 돌아가면 lock이 연결에 남으므로 연결 자체를 닫음
+            self._conn.invalidate()
+            self._conn.close()
+            self._conn = None
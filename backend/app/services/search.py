@@ -0,0 +1,36 @@
+import re
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
+
+# 단어 문자(한글/영문/숫자)만 남김 - 따옴표, '-' 등 to_tsquery 문법 문자가 섞이면 syntax error(500)
+_SEARCH_TERM = re.compile(r"[^\W_]+")
+MAX_SEARCH_TERMS = 8
+
+SEARCH_CONFIG = sa.literal_column("'simple'::regconfig")
+
+
+def prefix_tsquery(q: str) -> Optional[str]:
+    """
+    검색어 -> 'term1:* & term2:*' (모든 단어를 접두어로 포함)
+    - '키보드'로 '키보드를', '키보드는' 등 조사가 붙은 단어도 찾음
+    - 유효한 단어가 없으면 None
+    """
+    terms = _SEARCH_TERM.findall(q)[:MAX_SEARCH_TERMS]
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def to_tsquery(q: str):
+    return sa.func.to_tsquery(SEARCH_CONFIG, q)
+
+
+def search_rank(search_vector, query_expr):
+    """
+    ts_rank를 double precision으로 (keyset cursor 정렬 키)
+    - ts_rank는 real(float4) -> cursor의 float8 값과 비교하면 마지막 행이 자기 자신보다 작게 판정되어
+      다음 페이지에 같은 행이 반복됨, 처음부터 float8로 선택/비교해서 값이 그대로 왕복되게 함
+    """
+    return sa.cast(sa.func.ts_rank(search_vector, query_expr), DOUBLE_PRECISION)
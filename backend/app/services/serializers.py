@@ -0,0 +1,95 @@
+import operator
+from typing import Dict, Iterable, Tuple
+
+from app.models import CompatibleGroup
+from app.services.versions import get_version
+
+# model -> (column 이름 목록, 값을 한 번에 꺼내는 attrgetter)
+_column_accessors: Dict[type, Tuple[tuple, operator.attrgetter]] = {}
+
+
+def _column_accessor(model) -> Tuple[tuple, operator.attrgetter]:
+    accessor = _column_accessors.get(model)
+    if accessor is None:
+        names = tuple(c.name for c in model.__table__.columns)
+        accessor = (names, operator.attrgetter(*names))
+        _column_accessors[model] = accessor
+    return accessor
+
+
+def column_values(obj) -> dict:
+    """ORM 객체의 테이블 컬럼 값 dict (model별 attrgetter를 한 번만 만들어 재사용)"""
+    names, getter = _column_accessor(type(obj))
+    values = getter(obj)
+    if len(names) == 1:  # attrgetter에 이름이 하나면 tuple이 아닌 값 하나를 반환
+        values = (values,)
+    return dict(zip(names, values))
+
+
+def has_compatible_group(model) -> bool:
+    return hasattr(model, "compatible_group_id")
+
+
+def serialize_part(obj):
+    """부품 dict 변환, PCB/Case/Plate는 compatible_group_name 포함"""
+    if obj is None:
+        return None
+    data = column_values(obj)
+    if has_compatible_group(type(obj)):
+        group = obj.compatible_group
+        data["compatible_group_name"] = group.name if group else None
+    return data
+
+
+class PartPayloadCache:
+    """
+    (table, id) -> 직렬화된 부품 dict
+    - 테이블 버전(app.services.versions)이 바뀌면 그 테이블 항목을 통째로 폐기
+      (PCB/Case/Plate는 compatible_groups 변경도 포함)
+    - 저장은 조회한 세션의 버전(load_versions)이 현재 항목의 버전 이상일 때만
+      -> replica가 지연되어 예전 행을 읽었으면 새 버전 라벨 아래에 저장하지 않음
+    - 여러 빌드가 같은 dict를 공유하므로 호출 측에서 수정하지 않음
+    """
+
+    def __init__(self):
+        self._tables: Dict[str, Tuple[int, Dict[int, dict]]] = {}
+
+    @staticmethod
+    def tables(model) -> tuple:
+        """model 항목의 버전이 의존하는 테이블"""
+        table = model.__tablename__
+        return (table, CompatibleGroup.__tablename__) if has_compatible_group(model) else (table,)
+
+    def entries(self, model) -> Dict[int, dict]:
+        table = model.__tablename__
+        version = get_version(*self.tables(model))
+        current = self._tables.get(table)
+        if current is None or current[0] != version:
+            current = (version, {})
+            self._tables[table] = current
+        return current[1]
+
+    def split(self, model, ids: Iterable[int]) -> Tuple[Dict[int, dict], set]:
+        """ids -> (캐시에 있는 payload, 조회가 필요한 id)"""
+        entries = self.entries(model)
+        found, missing = {}, set()
+        for part_id in ids:
+            data = entries.get(part_id)
+            if data is None:
+                missing.add(part_id)
+            else:
+                found[part_id] = data
+        return found, missing
+
+    def store(self, model, loaded_version: int, payloads: Dict[int, dict]):
+        """loaded_version: payload를 조회한 세션에서 읽은 버전 (load_versions 합)"""
+        current = self._tables.get(model.__tablename__)
+        if current is not None and current[0] <= loaded_version:
+            current[1].update(payloads)
+
+    def clear(self):
+        """모든 항목 폐기 (다음 조회는 캐시 미스)"""
+        self._tables = {}
+
+
+part_payload_cache = PartPayloadCache()
@@ -0,0 +1,126 @@
+import itertools
+import threading
+import uuid
+from typing import Dict
+
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import TableVersion, DB_VERSION_KEYS
+
+# 프로세스 재시작 시 버전 카운터가 0부터 다시 시작하므로 구분용 ID
+BOOT_ID = uuid.uuid4().hex[:12]
+
+_CHANGED_TABLES_KEY = "changed_tables"
+
+_lock = threading.Lock()
+_versions: Dict[str, int] = {}
+
+# table_versions의 마지막으로 읽은 값 (sync_db_versions가 주기적으로 교체)
+# - DB_VERSIONED_TABLES(부품 테이블) + USERS_DELETED
+_db_versions: Dict[str, int] = dict.fromkeys(DB_VERSION_KEYS, 0)
+
+
+def get_version(*tables: str) -> int:
+    """
+    주어진 테이블들의 변경 버전 합 (테이블별 버전은 증가만 하므로 합도 단조 증가)
+    - DB_VERSIONED_TABLES: table_versions 값 (모든 프로세스 공통, poll 주기만큼 늦을 수 있음)
+    - 그 외: 이 프로세스에서 commit된 변경 횟수
+    """
+    db_versions = _db_versions
+    return sum(db_versions[t] if t in db_versions else _versions.get(t, 0) for t in tables)
+
+
+def is_db_versioned(*tables: str) -> bool:
+    """모든 테이블의 버전이 DB 기준인지 (프로세스/재시작과 무관하게 같은 값)"""
+    return all(t in _db_versions for t in tables)
+
+
+def bump(*tables: str) -> None:
+    with _lock:
+        for t in tables:
+            _versions[t] = _versions.get(t, 0) + 1
+
+
+def sync_db_versions() -> None:
+    """table_versions를 primary에서 읽어 교체 (주기 작업, 한 번의 작은 SELECT)"""
+    from app.database import engine
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            sa.select(TableVersion.table_name, TableVersion.version)
+            .where(TableVersion.table_name.in_(DB_VERSION_KEYS))
+        ).all()
+    global _db_versions
+    _db_versions = {**dict.fromkeys(DB_VERSION_KEYS, 0), **dict(rows)}
+
+
+def load_versions(db: Session, *tables: str) -> Dict[str, int]:
+    """load_version의 테이블별 값 (DB_VERSIONED_TABLES는 한 번의 조회)"""
+    versions = {t: _versions.get(t, 0) for t in tables if t not in _db_versions}
+    shared = [t for t in tables if t in _db_versions]
+    if shared:
+        loaded = dict(db.execute(
+            sa.select(TableVersion.table_name, TableVersion.version)
+            .where(TableVersion.table_name.in_(shared))
+        ).all())
+        versions.update({t: loaded.get(t, 0) for t in shared})
+    return versions
+
+
+def load_version(db: Session, *tables: str) -> int:
+    """
+    get_version과 같은 값을 db 세션에서 직접 읽기 (DB_VERSIONED_TABLES만 조회)
+    - 스냅샷/캐시를 만들 때 데이터보다 먼저 같은 세션에서 읽어 라벨로 사용
+      -> replica가 지연되어도 스냅샷 버전이 데이터보다 새 값으로 기록되지 않음
+    """
+    return sum(load_versions(db, *tables).values())
+
+
+def mark_changed(session: Session, *tables: str) -> None:
+    """이벤트로 잡히지 않는 변경(CTE 안의 INSERT/DELETE 등)을 commit 시 버전에 반영하도록 기록"""
+    session.info.setdefault(_CHANGED_TABLES_KEY, set()).update(tables)
+
+
+# --- 세션 이벤트: commit 된 변경만 버전에 반영 ---
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session, flush_context):
+    changed = session.info.setdefault(_CHANGED_TABLES_KEY, set())
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table:
+            changed.add(table)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_tables(orm_execute_state):
+    # db.execute(sa.update(...)) 처럼 flush를 거치지 않는 ORM DML
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            changed = orm_execute_state.session.info.setdefault(_CHANGED_TABLES_KEY, set())
+            changed.add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_tables(session):
+    changed = session.info.pop(_CHANGED_TABLES_KEY, None)
+    if changed:
+        bump(*changed)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_tables(session, previous_transaction):
+    session.info.pop(_CHANGED_TABLES_KEY, None)
+
+
+'''
+- 목적
+- 테이블 단위 변경 버전 관리
+- 스냅샷/캐시는 의존 테이블의 버전이 바뀌었을 때만 다시 만든다
+- 부품 테이블(DB_VERSIONED_TABLES)은 DB trigger가 올리는 table_versions 기준 -> seed/마이그레이션 등
+  다른 프로세스의 변경도 poll 주기 안에 모든 worker에 반영
+- 그 외 테이블은 프로세스 내 카운터 (다른 worker의 변경은 max_stale/TTL로 지연 상한을 둠)
+'''
@@ -0,0 +1,96 @@
+"""
+Performance Migration Script
+- Adds composite indexes for keyset (cursor) pagination on posts/comments/replies
+- Adds comment_count column to posts and backfills it
+- Adds hot_score columns to posts/builds and computes them
+- Adds generated search_vector (tsvector) column + GIN index to posts
+- Creates table_versions + statement triggers on part tables (installed by create_all)
+"""
+from sqlalchemy import text
+from app.database import engine, Base, SessionLocal
+from app.models import (
+    PCB, Case, Plate, Stabilizer, Switch, Keycap, CompatibleGroup,
+    User, Build, BuildLike,
+    Post, Comment, PostLike,
+)
+from app.models.community import SEARCH_VECTOR_SQL
+from app.services.counters import reconcile_comment_counts
+from app.services.hot import refresh_hot_scores
+
+# (index name, table, columns)
+KEYSET_INDEXES = [
+    ("ix_posts_created_at_id", "posts", "created_at, id"),
+    ("ix_posts_category_created_at_id", "posts", "category, created_at, id"),
+    ("ix_posts_hot_score_id", "posts", "hot_score, id"),
+    ("ix_posts_category_hot_score_id", "posts", "category, hot_score, id"),
+    ("ix_builds_is_public_hot_score_id", "builds", "is_public, hot_score, id"),
+    ("ix_builds_user_id_updated_at_id", "builds", "user_id, updated_at, id"),
+    ("ix_posts_user_id_created_at_id", "posts", "user_id, created_at, id"),
+    ("ix_comments_user_id_created_at_id", "comments", "user_id, created_at, id"),
+    ("ix_comments_post_id_parent_created_at_id", "comments", "post_id, parent_comment_id, created_at, id"),
+    ("ix_comments_parent_comment_id_created_at_id", "comments", "parent_comment_id, created_at, id"),
+]
+
+
+def run_migration():
+    with engine.connect() as conn:
+        # Add comment_count column to posts if not exists
+        result = conn.execute(text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = 'posts' AND column_name = 'comment_count'"
+        ))
+        if not result.fetchone():
+            conn.execute(text(
+                "ALTER TABLE posts ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0"
+            ))
+            print("Added comment_count column to posts")
+
+        # Add hot_score column to posts/builds if not exists
+        for table in ("posts", "builds"):
+            result = conn.execute(text(
+                "SELECT column_name FROM information_schema.columns "
+                f"WHERE table_name = '{table}' AND column_name = 'hot_score'"
+            ))
+            if not result.fetchone():
+                conn.execute(text(
+                    f"ALTER TABLE {table} ADD COLUMN hot_score DOUBLE PRECISION NOT NULL DEFAULT 0"
+                ))
+                print(f"Added hot_score column to {table}")
+
+        # Add generated search_vector column to posts if not exists
+        result = conn.execute(text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = 'posts' AND column_name = 'search_vector'"
+        ))
+        if not result.fetchone():
+            conn.execute(text(
+                f"ALTER TABLE posts ADD COLUMN search_vector tsvector "
+                f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+            ))
+            print("Added search_vector column to posts")
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_posts_search_vector ON posts USING gin (search_vector)"
+        ))
+
+        # Add composite indexes for cursor pagination
+        for name, table, columns in KEYSET_INDEXES:
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+        print("Added keyset pagination indexes on posts/comments/builds")
+
+        conn.commit()
+
+    Base.metadata.create_all(bind=engine)
+
+    # Backfill comment_count from existing comments
+    db = SessionLocal()
+    try:
+        print(f"Backfilled comment_count on {reconcile_comment_counts(db)} posts")
+        for model in (Post, Build):
+            print(f"Computed hot_score on {refresh_hot_scores(db, model)} {model.__tablename__}")
+    finally:
+        db.close()
+    print("Migration complete!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,99 @@
+"""
+테스트 공통 fixture
+
+    TEST_DATABASE_URL=postgresql://.../keyboard_builder_test pytest
+
+- postgres 표시 테스트는 TEST_DATABASE_URL의 PostgreSQL에서 실행 (테이블을 지우고 다시 만듦 -> 운영 DB 금지)
+- TEST_DATABASE_URL이 없으면 postgres 테스트는 이유와 함께 skip으로 보고됨
+- app은 DATABASE_URL을 import 시점에 읽으므로 app 모듈은 fixture 안에서 import
+"""
+import os
+import re
+import uuid
+from typing import List
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+    os.environ.pop("DATABASE_REPLICA_URLS", None)
+
+
+def pytest_collection_modifyitems(config, items):
+    if TEST_DATABASE_URL:
+        return
+    skip = pytest.mark.skip(reason="TEST_DATABASE_URL 미설정 - PostgreSQL 테스트 건너뜀")
+    for item in items:
+        if "postgres" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def database():
+    """빈 스키마 + seed 부품 카탈로그"""
+    from app.database import Base, engine
+    from app.seed import seed_data
+    from app.services.versions import sync_db_versions
+    import app.models  # noqa: F401
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    seed_data()
+    sync_db_versions()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def client(database):
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def auth_headers(client):
+    """새 사용자로 가입 -> Authorization 헤더"""
+    email = f"test-{uuid.uuid4().hex[:8]}@example.com"
+    response = client.post(
+        "/api/auth/register", json={"email": email, "password": "test-password", "nickname": "tester"},
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+class QueryCounter:
+    """모든 engine(primary/replica/async)의 실행 SQL 기록"""
+
+    JOIN = re.compile(r"\bJOIN\b", re.IGNORECASE)
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    def record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def reset(self):
+        self.statements = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def max_joins(self) -> int:
+        """statement 하나의 최대 JOIN 수"""
+        return max((len(self.JOIN.findall(s)) for s in self.statements), default=0)
+
+
+@pytest.fixture
+def query_counter():
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    counter = QueryCounter()
+    event.listen(Engine, "before_cursor_execute", counter.record)
+    yield counter
+    event.remove(Engine, "before_cursor_execute", counter.record)
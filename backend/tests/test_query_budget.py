@@ -0,0 +1,149 @@
+"""
+builds/community API의 SQL 실행 수/JOIN 수 회귀 테스트
+
+- 엔드포인트를 한 번씩 호출하면서 실행된 SQL을 기록 (query_counter)
+- statement 수, statement 하나의 최대 JOIN 수가 budget을 넘으면 실패
+- 캐시(사용자, 부품 payload, 공개 빌드 피드)는 호출마다 비우고 측정 -> 캐시 미스 기준 최악의 경우
+- 좋아요(CTE)/검색(tsvector) 등 PostgreSQL 전용 SQL이 있어 전체를 PostgreSQL에서 실행
+"""
+import re
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+pytestmark = pytest.mark.postgres
+
+
+@dataclass
+class Budget:
+    name: str
+    method: str
+    path: str  # {build_id}, {post_id} 등은 fixture 값으로 채움
+    statements: int  # 최대 statement 수
+    joins: int  # statement 하나의 최대 JOIN 수
+    auth: bool = True
+    body: Optional[dict] = None
+
+
+# 순서대로 실행 (삭제/좋아요는 전용 fixture 사용)
+BUDGETS = [
+    # builds
+    Budget("my builds", "GET", "/api/builds", 1, 0),
+    Budget("build detail", "GET", "/api/builds/{build_id}", 9, 0),
+    Budget("popular builds", "GET", "/api/builds/popular", 9, 1, auth=False),
+    Budget("recent builds", "GET", "/api/builds/recent", 10, 1),
+    Budget("create build", "POST", "/api/builds", 2, 0, body={"name": "budget", "is_public": True}),
+    Budget("update build", "PUT", "/api/builds/{build_id}", 10, 0, body={"name": "budget renamed"}),
+    Budget("like build", "POST", "/api/builds/{like_build_id}/like", 2, 0),
+    Budget("delete build", "DELETE", "/api/builds/{delete_build_id}", 4, 0),
+    # community
+    Budget("posts recent", "GET", "/api/community/posts", 12, 0),
+    Budget("posts popular", "GET", "/api/community/posts?sort=popular", 12, 0),
+    Budget("my posts", "GET", "/api/community/me/posts", 12, 0),
+    Budget("my comments", "GET", "/api/community/me/comments", 1, 1),
+    Budget("search posts", "GET", "/api/community/search?q=budget", 12, 0),
+    Budget("post detail", "GET", "/api/community/posts/{post_id}", 14, 2),
+    Budget("comments", "GET", "/api/community/posts/{post_id}/comments", 4, 2),
+    Budget("replies", "GET", "/api/community/comments/{comment_id}/replies", 2, 1),
+    Budget("create post", "POST", "/api/community/posts", 14, 0, body={
+        "title": "budget post", "content": "budget", "category": "showcase", "build_id": "{build_id}",
+    }),
+    Budget("update post", "PUT", "/api/community/posts/{post_id}", 17, 2, body={"title": "budget post renamed"}),
+    Budget("like post", "POST", "/api/community/posts/{post_id}/like", 2, 0),
+    Budget("create comment", "POST", "/api/community/posts/{post_id}/comments", 6, 0, body={"content": "budget"}),
+    Budget("delete comment", "DELETE", "/api/community/comments/{delete_comment_id}", 6, 0),
+    Budget("delete post", "DELETE", "/api/community/posts/{delete_post_id}", 5, 0),
+]
+
+
+def _first_part_ids() -> dict:
+    from app.database import SessionLocal
+    from app.models import PCB, Case, Plate, Stabilizer, Switch, Keycap
+
+    db = SessionLocal()
+    try:
+        return {
+            f"{slot}_id": db.query(model.id).order_by(model.id).limit(1).scalar()
+            for slot, model in (
+                ("pcb", PCB), ("case", Case), ("plate", Plate),
+                ("stabilizer", Stabilizer), ("switch", Switch), ("keycap", Keycap),
+            )
+        }
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="module")
+def budget_data(client):
+    """점검용 사용자와 데이터 생성 -> (인증 헤더, user id, path 치환 값)"""
+    email = f"budget-{uuid.uuid4().hex[:8]}@example.com"
+    token = client.post(
+        "/api/auth/register", json={"email": email, "password": "budget-check", "nickname": "budget"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def post(path, body):
+        response = client.post(path, json=body, headers=headers)
+        response.raise_for_status()
+        return response.json()["id"]
+
+    parts = _first_part_ids()
+    builds = [post("/api/builds", {"name": f"budget {i}", "is_public": True, **parts}) for i in range(3)]
+    posts = [
+        post("/api/community/posts", {
+            "title": f"budget {i}", "content": "budget", "category": "showcase", "build_id": builds[0],
+        })
+        for i in range(2)
+    ]
+    comment = post(f"/api/community/posts/{posts[0]}/comments", {"content": "budget"})
+    for _ in range(2):
+        post(f"/api/community/posts/{posts[0]}/comments", {"content": "reply", "parent_comment_id": comment})
+    delete_comment = post(f"/api/community/posts/{posts[0]}/comments", {"content": "to delete"})
+
+    values = {
+        "build_id": builds[0], "like_build_id": builds[1], "delete_build_id": builds[2],
+        "post_id": posts[0], "delete_post_id": posts[1],
+        "comment_id": comment, "delete_comment_id": delete_comment,
+    }
+    user_id = client.get("/api/auth/me", headers=headers).json()["id"]
+    return headers, user_id, values
+
+
+def _fill(value, values: dict):
+    if isinstance(value, str):
+        if re.fullmatch(r"\{\w+\}", value):
+            return values[value[1:-1]]
+        return value.format(**values)
+    if isinstance(value, dict):
+        return {k: _fill(v, values) for k, v in value.items()}
+    return value
+
+
+def _reset_caches(user_id: int):
+    from app.auth import user_cache
+    from app.services.feed_cache import build_feed_cache
+    from app.services.serializers import part_payload_cache
+
+    part_payload_cache.clear()
+    build_feed_cache.invalidate()
+    user_cache.invalidate(user_id)
+
+
+@pytest.mark.parametrize("budget", BUDGETS, ids=[budget.name for budget in BUDGETS])
+def test_query_budget(client, budget_data, query_counter, budget):
+    headers, user_id, values = budget_data
+    _reset_caches(user_id)
+    query_counter.reset()
+
+    response = client.request(
+        budget.method,
+        _fill(budget.path, values),
+        json=_fill(budget.body, values),
+        headers=headers if budget.auth else None,
+    )
+
+    assert response.status_code < 400, response.text[:200]
+    assert query_counter.count <= budget.statements, "\n".join(query_counter.statements)
+    assert query_counter.max_joins <= budget.joins, "\n".join(query_counter.statements)
@@ -0,0 +1,82 @@
+import uuid
+
+import pytest
+
+from app.services.search import MAX_SEARCH_TERMS, prefix_tsquery
+
+# to_tsquery 문법 문자가 섞인 검색어 (예전에는 syntax error -> 500)
+OPERATOR_QUERIES = [
+    '"hot-swap"',
+    "-gasket",
+    "foo & | ! bar",
+    "(tofu",
+    "keycap:*",
+    "it's <-> 'ok'",
+    "back\\slash",
+    "키보드, 스위치!",
+]
+
+
+def test_prefix_tsquery_keeps_word_characters_only():
+    assert prefix_tsquery('"hot-swap" -gasket') == "hot:* & swap:* & gasket:*"
+    assert prefix_tsquery("키보드를 추천") == "키보드를:* & 추천:*"
+    assert prefix_tsquery("under_score") == "under:* & score:*"
+
+
+def test_prefix_tsquery_without_words():
+    assert prefix_tsquery("\"-!&|()':*") is None
+    assert prefix_tsquery("   ") is None
+
+
+def test_prefix_tsquery_limits_terms():
+    assert prefix_tsquery(" ".join(f"w{i}" for i in range(20))).count(":*") == MAX_SEARCH_TERMS
+
+
+@pytest.mark.postgres
+@pytest.mark.parametrize("q", OPERATOR_QUERIES)
+def test_search_with_tsquery_operators(client, q):
+    response = client.get("/api/community/search", params={"q": q})
+    assert response.status_code == 200, response.text
+
+
+@pytest.mark.postgres
+def test_search_matches_prefix(client, auth_headers):
+    response = client.post("/api/community/posts", headers=auth_headers, json={
+        "title": "Tofu60 hot-swap 후기", "content": "키보드를 조립했습니다", "category": "review",
+    })
+    response.raise_for_status()
+    post_id = response.json()["id"]
+
+    for q in ('"hot-swap"', "tofu", "키보드"):
+        response = client.get("/api/community/search", params={"q": q})
+        assert response.status_code == 200, response.text
+        assert post_id in [post["id"] for post in response.json()], q
+
+
+@pytest.mark.postgres
+def test_search_pages_are_unique_and_complete(client, auth_headers):
+    # 같은 rank가 여럿인 경우 포함 (제목/본문 반복 횟수로 rank를 다르게)
+    word = f"walk{uuid.uuid4().hex[:8]}"
+    created = set()
+    for i in range(7):
+        response = client.post("/api/community/posts", headers=auth_headers, json={
+            "title": f"{word} {i}", "content": " ".join([word] * (i % 3 + 1)), "category": "info",
+        })
+        response.raise_for_status()
+        created.add(response.json()["id"])
+
+    seen, cursor = [], None
+    for _ in range(len(created) + 1):  # cursor가 되풀이되면 여기서 끝남
+        params = {"q": word, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/community/search", params=params)
+        assert response.status_code == 200, response.text
+        seen += [post["id"] for post in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert cursor is None
+    assert len(seen) == len(set(seen))
+    assert set(seen) == created
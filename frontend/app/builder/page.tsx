@@ -123,7 +123,13 @@ function BuilderContent() {
     const filteredSwitches = useMemo(() => applyFilters(switches, switchFilters, switchFilterConfig), [switches, switchFilters, switchFilterConfig]);
     const filteredKeycaps = useMemo(() => applyFilters(keycaps, keycapFilters, keycapFilterConfig), [keycaps, keycapFilters, keycapFilterConfig]);
 
-    const { data: builds = [], isLoading: buildsLoading } = useBuilds(token);
+    const {
+        data: builds = [],
+        isLoading: buildsLoading,
+        hasNextPage: hasMoreBuilds,
+        fetchNextPage: fetchMoreBuilds,
+        isFetchingNextPage: buildsLoadingMore,
+    } = useBuilds(token);
     const saveBuild = useSaveBuild(token);
     const updateBuild = useUpdateBuild(token);
     const deleteBuildMutation = useDeleteBuild(token);
@@ -587,6 +593,9 @@ function BuilderContent() {
                 onOpenChange={setLoadDialogOpen}
                 builds={builds}
                 isLoading={buildsLoading}
+                hasMore={hasMoreBuilds}
+                isLoadingMore={buildsLoadingMore}
+                onLoadMore={() => fetchMoreBuilds()}
                 onLoad={handleLoadBuild}
                 onDelete={handleDeleteBuild}
                 deletingId={deletingId}
@@ -118,7 +118,13 @@ export default function CommunityPage() {
     const [selectedCategory, setSelectedCategory] = useState<PostCategory | "all">("all");
     const [sort, setSort] = useState<"recent" | "popular">("recent");
 
-    const { data: posts, isLoading: postsLoading } = usePosts({
+    const {
+        data: posts,
+        isLoading: postsLoading,
+        hasNextPage,
+        fetchNextPage,
+        isFetchingNextPage,
+    } = usePosts({
         category: selectedCategory === "all" ? undefined : selectedCategory,
         sort,
     }, resolvedToken);
@@ -199,6 +205,15 @@ export default function CommunityPage() {
                                 canLike={!!token}
                             />
                         ))}
+                        {hasNextPage && (
+                            <button
+                                onClick={() => fetchNextPage()}
+                                disabled={isFetchingNextPage}
+                                className="w-full py-3 text-sm font-semibold text-gray-400 hover:text-gray-600 dark:hover:text-gray-300 disabled:opacity-50 transition-colors"
+                            >
+                                {isFetchingNextPage ? "..." : "게시글 더 보기"}
+                            </button>
+                        )}
                     </div>
                 )}
             </div>
@@ -8,6 +8,7 @@ import { SiteHeader } from "@/components/site-header";
 import {
     usePost, useTogglePostLike, useCreateComment, useDeleteComment, useDeletePost,
 } from "@/lib/hooks";
+import { getCommentPage, getReplyPage } from "@/lib/api";
 import { CommentData, PostCategory, SelectedParts } from "@/lib/types";
 import { Keyboard3D } from "@/components/keyboard-3d";
 
@@ -132,9 +133,25 @@ function CommentItem({
     isPending, deletingCommentId, onReplyClick, onReplyTextChange, onReplySubmit, onReplyCancel, onDeleteRequest,
 }: CommentItemProps) {
     const [showReplies, setShowReplies] = useState(true);
+    const [moreReplies, setMoreReplies] = useState<{ items: CommentData[]; cursor: string | null } | null>(null);
+    const [loadingReplies, setLoadingReplies] = useState(false);
+    const replies = [...comment.replies, ...(moreReplies?.items ?? [])];
+    const repliesCursor = moreReplies ? moreReplies.cursor : comment.replies_cursor;
+    const replyCount = comment.reply_count ?? comment.replies.length;
     const isReply = comment.parent_comment_id !== null;
     const isOwn = currentUserId === comment.author.id;
 
+    const loadMoreReplies = async () => {
+        if (!repliesCursor) return;
+        setLoadingReplies(true);
+        try {
+            const page = await getReplyPage(comment.id, repliesCursor);
+            setMoreReplies({ items: [...(moreReplies?.items ?? []), ...page.items], cursor: page.nextCursor });
+        } finally {
+            setLoadingReplies(false);
+        }
+    };
+
     const timeAgo = (dateStr: string) => {
         const now = Date.now();
         const diff = now - new Date(dateStr).getTime();
@@ -205,18 +222,18 @@ function CommentItem({
                 )}
 
                 {/* Replies toggle + list */}
-                {!isReply && comment.replies.length > 0 && (
+                {!isReply && replyCount > 0 && (
                     <div className="mt-2">
                         <button
                             onClick={() => setShowReplies(!showReplies)}
                             className="flex items-center gap-2 text-xs font-semibold text-gray-400 hover:text-gray-600 dark:hover:text-gray-300 transition-colors"
                         >
                             <span className="w-6 h-px bg-gray-300 dark:bg-gray-600" />
-                            {showReplies ? "답글 숨기기" : `답글 보기 (${comment.replies.length}개)`}
+                            {showReplies ? "답글 숨기기" : `답글 보기 (${replyCount}개)`}
                         </button>
                         {showReplies && (
                             <div className="mt-2 space-y-3">
-                                {comment.replies.map((reply) => (
+                                {replies.map((reply) => (
                                     <CommentItem
                                         key={reply.id}
                                         comment={reply}
@@ -234,6 +251,15 @@ function CommentItem({
                                         onDeleteRequest={onDeleteRequest}
                                     />
                                 ))}
+                                {repliesCursor && (
+                                    <button
+                                        onClick={loadMoreReplies}
+                                        disabled={loadingReplies}
+                                        className="text-xs font-semibold text-gray-400 hover:text-gray-600 dark:hover:text-gray-300 disabled:opacity-50 transition-colors"
+                                    >
+                                        {loadingReplies ? "..." : `답글 더 보기 (${replyCount - replies.length}개)`}
+                                    </button>
+                                )}
                             </div>
                         )}
                     </div>
@@ -261,6 +287,8 @@ export default function PostDetailPage() {
     const [deletingCommentId, setDeletingCommentId] = useState<number | null>(null);
     const [replyingTo, setReplyingTo] = useState<number | null>(null);
     const [replyText, setReplyText] = useState("");
+    const [moreComments, setMoreComments] = useState<{ items: CommentData[]; cursor: string | null } | null>(null);
+    const [loadingComments, setLoadingComments] = useState(false);
 
     if (isLoading) {
         return (
@@ -307,6 +335,19 @@ export default function PostDetailPage() {
         });
     };
 
+    const commentsCursor = moreComments ? moreComments.cursor : post.comments_cursor;
+
+    const loadMoreComments = async () => {
+        if (!commentsCursor) return;
+        setLoadingComments(true);
+        try {
+            const page = await getCommentPage(postId, commentsCursor);
+            setMoreComments({ items: [...(moreComments?.items ?? []), ...page.items], cursor: page.nextCursor });
+        } finally {
+            setLoadingComments(false);
+        }
+    };
+
     const handleSubmitReply = async (parentCommentId: number) => {
         if (!replyText.trim() || !token) return;
         await createComment.mutateAsync({ postId, content: replyText.trim(), parentCommentId });
@@ -429,7 +470,7 @@ export default function PostDetailPage() {
                                 아직 댓글이 없습니다. 첫 댓글을 남겨보세요.
                             </p>
                         )}
-                        {post.comments.map((comment) => (
+                        {[...post.comments, ...(moreComments?.items ?? [])].map((comment) => (
                             <CommentItem
                                 key={comment.id}
                                 comment={comment}
@@ -450,6 +491,15 @@ export default function PostDetailPage() {
                                 onDeleteRequest={setDeletingCommentId}
                             />
                         ))}
+                        {commentsCursor && (
+                            <button
+                                onClick={loadMoreComments}
+                                disabled={loadingComments}
+                                className="w-full text-sm font-semibold text-gray-400 hover:text-gray-600 dark:hover:text-gray-300 disabled:opacity-50 transition-colors"
+                            >
+                                {loadingComments ? "..." : "댓글 더 보기"}
+                            </button>
+                        )}
                     </div>
 
                     {/* Comment input - Instagram style at bottom */}
@@ -15,6 +15,9 @@ interface LoadBuildsDialogProps {
     onOpenChange: (open: boolean) => void;
     builds: BuildListItem[];
     isLoading: boolean;
+    hasMore: boolean;
+    isLoadingMore: boolean;
+    onLoadMore: () => void;
     onLoad: (buildId: number) => void;
     onDelete: (buildId: number) => void;
     deletingId: number | null;
@@ -25,6 +28,9 @@ export function LoadBuildsDialog({
     onOpenChange,
     builds,
     isLoading,
+    hasMore,
+    isLoadingMore,
+    onLoadMore,
     onLoad,
     onDelete,
     deletingId,
@@ -95,6 +101,15 @@ export function LoadBuildsDialog({
                             </div>
                         </div>
                     ))}
+                    {hasMore && (
+                        <button
+                            onClick={onLoadMore}
+                            disabled={isLoadingMore}
+                            className="w-full text-sm font-semibold text-gray-400 hover:text-gray-600 dark:hover:text-gray-300 disabled:opacity-50 transition-colors"
+                        >
+                            {isLoadingMore ? "..." : "빌드 더 보기"}
+                        </button>
+                    )}
                 </div>
             </DialogContent>
         </Dialog>
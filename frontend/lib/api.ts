@@ -2,7 +2,7 @@ import {
     AllParts, Build, BuildListItem, BuildCreateData, BuildUpdateData,
     PublicBuild, LikeResponse, UserUpdate, PasswordChange,
     PostListItem, PostDetail, PostCreateData, PostCategory, CommentData,
-    MyComment,
+    MyComment, CursorPage,
 } from "./types";
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000/api";
@@ -30,15 +30,8 @@ export async function createBuild(token: string, data: BuildCreateData): Promise
     return res.json();
 }
 
-export async function getBuilds(token: string): Promise<BuildListItem[]> {
-    const res = await fetch(`${API_URL}/builds`, {
-        headers: { Authorization: `Bearer ${token}` },
-    });
-    if (!res.ok) {
-        const error = await res.json();
-        throw new Error(error.detail || "Failed to fetch builds");
-    }
-    return res.json();
+export async function getBuilds(token: string, cursor: string | null = null): Promise<CursorPage<BuildListItem>> {
+    return getCursorPage(`${API_URL}/builds`, cursor, "Failed to fetch builds", token);
 }
 
 export async function getBuild(token: string, id: number): Promise<Build> {
@@ -86,7 +79,7 @@ export async function getPopularBuilds(token?: string | null, limit = 8): Promis
     if (token) {
         headers.Authorization = `Bearer ${token}`;
     }
-    const res = await fetch(`${API_URL}/builds/popular?limit=${limit}`, { headers, cache: 'no-store' });
+    const res = await fetch(`${API_URL}/builds/popular?limit=${limit}`, { headers, cache: 'no-cache' });
     if (!res.ok) {
         const error = await res.json();
         throw new Error(error.detail || "Failed to fetch popular builds");
@@ -99,7 +92,7 @@ export async function getRecentBuilds(token?: string | null, limit = 8): Promise
     if (token) {
         headers.Authorization = `Bearer ${token}`;
     }
-    const res = await fetch(`${API_URL}/builds/recent?limit=${limit}`, { headers, cache: 'no-store' });
+    const res = await fetch(`${API_URL}/builds/recent?limit=${limit}`, { headers, cache: 'no-cache' });
     if (!res.ok) {
         const error = await res.json();
         throw new Error(error.detail || "Failed to fetch recent builds");
@@ -166,25 +159,15 @@ export async function deleteAccount(token: string): Promise<void> {
 // Community
 
 export async function getPosts(
-    params?: { category?: PostCategory; sort?: string; limit?: number; offset?: number },
+    params: { category?: PostCategory; sort?: string; limit?: number },
+    cursor: string | null,
     token?: string | null,
-): Promise<PostListItem[]> {
+): Promise<CursorPage<PostListItem>> {
     const searchParams = new URLSearchParams();
-    if (params?.category) searchParams.set("category", params.category);
-    if (params?.sort) searchParams.set("sort", params.sort);
-    if (params?.limit) searchParams.set("limit", String(params.limit));
-    if (params?.offset) searchParams.set("offset", String(params.offset));
-
-    const headers: Record<string, string> = {};
-    if (token) {
-        headers.Authorization = `Bearer ${token}`;
-    }
-    const res = await fetch(`${API_URL}/community/posts?${searchParams.toString()}`, { headers, cache: 'no-store' });
-    if (!res.ok) {
-        const error = await res.json();
-        throw new Error(error.detail || "Failed to fetch posts");
-    }
-    return res.json();
+    if (params.category) searchParams.set("category", params.category);
+    if (params.sort) searchParams.set("sort", params.sort);
+    if (params.limit) searchParams.set("limit", String(params.limit));
+    return getCursorPage(`${API_URL}/community/posts`, cursor, "Failed to fetch posts", token, searchParams);
 }
 
 export async function getPost(postId: number, token?: string | null): Promise<PostDetail> {
@@ -267,6 +250,32 @@ export async function getComments(postId: number): Promise<CommentData[]> {
     return res.json();
 }
 
+async function getCursorPage<T>(
+    url: string,
+    cursor: string | null,
+    errorMessage: string,
+    token?: string | null,
+    searchParams: URLSearchParams = new URLSearchParams(),
+): Promise<CursorPage<T>> {
+    if (cursor) searchParams.set("cursor", cursor);
+    const headers: Record<string, string> = {};
+    if (token) headers.Authorization = `Bearer ${token}`;
+    const res = await fetch(`${url}?${searchParams.toString()}`, { headers, cache: 'no-store' });
+    if (!res.ok) {
+        const error = await res.json();
+        throw new Error(error.detail || errorMessage);
+    }
+    return { items: await res.json(), nextCursor: res.headers.get("X-Next-Cursor") };
+}
+
+export async function getCommentPage(postId: number, cursor: string | null): Promise<CursorPage<CommentData>> {
+    return getCursorPage(`${API_URL}/community/posts/${postId}/comments`, cursor, "Failed to fetch comments");
+}
+
+export async function getReplyPage(commentId: number, cursor: string | null): Promise<CursorPage<CommentData>> {
+    return getCursorPage(`${API_URL}/community/comments/${commentId}/replies`, cursor, "Failed to fetch replies");
+}
+
 export async function createComment(
     token: string,
     postId: number,
@@ -1,4 +1,4 @@
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query"
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient, InfiniteData, QueryClient } from "@tanstack/react-query"
 import {
     getAllParts, getBuilds, getBuild, createBuild, updateBuild, deleteBuild,
     updateProfile, changePassword, deleteAccount,
@@ -10,7 +10,7 @@ import {
     AllParts, BuildListItem, Build, BuildCreateData, BuildUpdateData,
     LikeResponse, UserUpdate, PasswordChange,
     PostListItem, PostDetail, PostCreateData, PostCategory, CommentData,
-    MyComment,
+    MyComment, CursorPage,
 } from "./types"
 
 /** Read the freshest token directly from localStorage to avoid stale closures */
@@ -31,12 +31,17 @@ export function useAllParts() {
 
 // User builds
 
+/** Saved builds, most recently updated first. `data` is the pages loaded so far; call fetchNextPage for more. */
 export function useBuilds(token: string | null) {
-    return useQuery<BuildListItem[]>({
-        queryKey: ["builds"],
-        queryFn: () => getBuilds(token!),
+    const query = useInfiniteQuery({
+        queryKey: ["builds", "list"],
+        queryFn: ({ pageParam }) => getBuilds(token!, pageParam),
+        initialPageParam: null as string | null,
+        getNextPageParam: (lastPage) => lastPage.nextCursor,
         enabled: !!token,
     })
+    const data: BuildListItem[] | undefined = query.data?.pages.flatMap((page) => page.items)
+    return { ...query, data }
 }
 
 export function useBuild(token: string | null, buildId: number | null) {
@@ -101,11 +106,34 @@ export function useDeleteAccount(token: string | null) {
 // Community - Posts
 
 export function usePosts(params?: { category?: PostCategory; sort?: string }, token?: string | null) {
-    return useQuery<PostListItem[]>({
-        queryKey: ["posts", params?.category, params?.sort, !!token],
-        queryFn: () => getPosts(params, freshToken()),
+    const query = useInfiniteQuery({
+        queryKey: ["posts", "list", params?.category, params?.sort, !!token],
+        queryFn: ({ pageParam }) => getPosts({ category: params?.category, sort: params?.sort }, pageParam, freshToken()),
+        initialPageParam: null as string | null,
+        getNextPageParam: (lastPage) => lastPage.nextCursor,
         enabled: token !== undefined,
     })
+    const data: PostListItem[] | undefined = query.data?.pages.flatMap((page) => page.items)
+    return { ...query, data }
+}
+
+type PostListPages = InfiniteData<CursorPage<PostListItem>, string | null>
+
+/** 모든 게시글 목록 캐시(페이지 단위)의 항목을 갱신 - 이전 값 반환 (onError 복구용) */
+function updatePostLists(
+    queryClient: QueryClient,
+    update: (post: PostListItem) => PostListItem,
+): Array<{ key: readonly unknown[]; data: PostListPages }> {
+    const prevLists: Array<{ key: readonly unknown[]; data: PostListPages }> = []
+    queryClient.getQueriesData<PostListPages>({ queryKey: ["posts", "list"] }).forEach(([key, data]) => {
+        if (!data?.pages) return
+        prevLists.push({ key, data })
+        queryClient.setQueryData<PostListPages>(key, {
+            ...data,
+            pages: data.pages.map((page) => ({ ...page, items: page.items.map(update) })),
+        })
+    })
+    return prevLists
 }
 
 export function usePost(postId: number | null, token?: string | null) {
@@ -167,16 +195,11 @@ export function useTogglePostLike(token: string | null) {
             }
 
             // Update all post list caches optimistically
-            const prevLists: Array<{ key: readonly unknown[]; data: PostListItem[] }> = []
-            queryClient.getQueriesData<PostListItem[]>({ queryKey: ["posts"] }).forEach(([key, data]) => {
-                if (!Array.isArray(data)) return
-                prevLists.push({ key, data })
-                queryClient.setQueryData<PostListItem[]>(key, data.map(p =>
-                    p.id === postId
-                        ? { ...p, is_liked: !p.is_liked, like_count: p.is_liked ? p.like_count - 1 : p.like_count + 1 }
-                        : p
-                ))
-            })
+            const prevLists = updatePostLists(queryClient, p =>
+                p.id === postId
+                    ? { ...p, is_liked: !p.is_liked, like_count: p.is_liked ? p.like_count - 1 : p.like_count + 1 }
+                    : p
+            )
 
             return { prevDetail, prevLists }
         },
@@ -189,14 +212,11 @@ export function useTogglePostLike(token: string | null) {
                     like_count: data.like_count,
                 })
             }
-            queryClient.getQueriesData<PostListItem[]>({ queryKey: ["posts"] }).forEach(([key, list]) => {
-                if (!Array.isArray(list)) return
-                queryClient.setQueryData<PostListItem[]>(key, list.map(p =>
-                    p.id === postId
-                        ? { ...p, is_liked: data.liked, like_count: data.like_count }
-                        : p
-                ))
-            })
+            updatePostLists(queryClient, p =>
+                p.id === postId
+                    ? { ...p, is_liked: data.liked, like_count: data.like_count }
+                    : p
+            )
         },
         onError: (_err: Error, postId: number, context) => {
             if (context?.prevDetail) {
@@ -226,12 +246,9 @@ export function useCreateComment(token: string | null) {
             createComment(token!, postId, content, parentCommentId),
         onMutate: async ({ postId }) => {
             // Optimistically increment comment_count in all post list caches
-            queryClient.getQueriesData<PostListItem[]>({ queryKey: ["posts"] }).forEach(([key, data]) => {
-                if (!Array.isArray(data)) return
-                queryClient.setQueryData<PostListItem[]>(key, data.map(p =>
-                    p.id === postId ? { ...p, comment_count: p.comment_count + 1 } : p
-                ))
-            })
+            updatePostLists(queryClient, p =>
+                p.id === postId ? { ...p, comment_count: p.comment_count + 1 } : p
+            )
             // Optimistically increment in post detail cache (logged in = true)
             const detailKey = ["posts", postId, true] as const
             const prevDetail = queryClient.getQueryData<PostDetail>(detailKey)
@@ -256,12 +273,9 @@ export function useDeleteComment(token: string | null, postId?: number | null) {
         onMutate: async () => {
             if (!postId) return
             // Optimistically decrement comment_count in all post list caches
-            queryClient.getQueriesData<PostListItem[]>({ queryKey: ["posts"] }).forEach(([key, data]) => {
-                if (!Array.isArray(data)) return
-                queryClient.setQueryData<PostListItem[]>(key, data.map(p =>
-                    p.id === postId ? { ...p, comment_count: Math.max(0, p.comment_count - 1) } : p
-                ))
-            })
+            updatePostLists(queryClient, p =>
+                p.id === postId ? { ...p, comment_count: Math.max(0, p.comment_count - 1) } : p
+            )
             // Optimistically decrement in post detail cache (logged in = true)
             const detailKey = ["posts", postId, true] as const
             const prevDetail = queryClient.getQueryData<PostDetail>(detailKey)
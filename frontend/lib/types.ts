@@ -237,9 +237,16 @@ export interface CommentData {
     author: PostAuthor;
     parent_comment_id: number | null;
     replies: CommentData[];
+    reply_count: number;
+    replies_cursor: string | null;
     created_at: string;
 }
 
+export interface CursorPage<T> {
+    items: T[];
+    nextCursor: string | null;
+}
+
 export interface PostDetail {
     id: number;
     title: string;
@@ -251,6 +258,7 @@ export interface PostDetail {
     author: PostAuthor;
     build: Build | null;
     comments: CommentData[];
+    comments_cursor: string | null;
     created_at: string;
     updated_at: string;
 }